@@ -0,0 +1,58 @@
+"""
+Benchmark merge_sort on random, sorted, reversed and "sorted with k% noise" inputs,
+against bubble_sort and the built-in sort.
+
+Usage:
+    python -m benchmarks.bench_merge_sort [--sizes 1000 100000] [--noise 1 5 10] [--repeat 3]
+"""
+import argparse
+import random
+import timeit
+
+import dsaria.sort
+
+# bubble_sort is quadratic on anything but presorted input; skip it above this size.
+BUBBLE_MAX_SIZE = 2000
+
+def _inputs(n: int, noise: list) -> dict:
+    """Return the named input distributions of size n."""
+    inputs = {
+        "random": [random.random() for _ in range(n)],
+        "sorted": list(range(n)),
+        "reversed": list(range(n, 0, -1)),
+    }
+    for pct in noise:
+        arr = list(range(n))
+        for _ in range(n * pct // 100): arr[random.randrange(n)] = random.randrange(n)
+        inputs[f"sorted + {pct}% noise"] = arr
+    return inputs
+
+def _best_of(fn, arr: list, repeat: int) -> float:
+    """Return the fastest of repeat runs of fn on a fresh copy of arr, in seconds."""
+    return min(timeit.repeat(lambda: fn(list(arr)), number=1, repeat=repeat))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100_000])
+    parser.add_argument("--noise", type=int, nargs="+", default=[1, 5, 10])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    algorithms = {
+        "merge_sort": lambda a: dsaria.sort.merge_sort(arr=a),
+        "bubble_sort": lambda a: dsaria.sort.bubble_sort(arr=a),
+        "sorted": sorted,
+    }
+    print(f"{'n':>9} {'input':<22} " + " ".join(f"{name:>12}" for name in algorithms))
+    for n in args.sizes:
+        for name, arr in _inputs(n, args.noise).items():
+            cells = []
+            for algo, fn in algorithms.items():
+                if algo == "bubble_sort" and n > BUBBLE_MAX_SIZE and name != "sorted":
+                    cells.append(f"{'-':>12}")
+                    continue
+                cells.append(f"{_best_of(fn, arr, args.repeat):>12.5f}")
+            print(f"{n:>9} {name:<22} " + " ".join(cells))
+
+if __name__ == "__main__":
+    main()
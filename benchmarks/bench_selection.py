@@ -0,0 +1,57 @@
+"""
+Compare selection, partial sorting and lazy sorted iteration against a full sort, on random floats
+and on a two-valued integer column.
+
+Usage:
+    python -m benchmarks.bench_selection [--sizes 100000 1000000] [--repeat 3]
+"""
+import argparse
+import heapq
+import random
+import timeit
+from itertools import islice
+
+import dsaria.sort
+
+def _best_of(fn, repeat: int) -> float:
+    """Return the fastest of repeat single runs of fn, in seconds."""
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'n':>9} {'operation':<32} {'seconds':>9} {'vs sorted':>9}")
+    for n in args.sizes:
+        arr = [random.random() for _ in range(n)]
+        # A low-cardinality column, selected at the boundary between its two values.
+        binary = [random.randrange(2) for _ in range(n)]
+        zeros = binary.count(0)
+        cases = {
+            "sorted(arr)": lambda: sorted(arr),
+            "sort(arr=arr)": lambda: dsaria.sort.sort(arr=arr),
+            "select median": lambda: dsaria.sort.select(arr=arr, k=n // 2),
+            "select p99": lambda: dsaria.sort.select(arr=arr, k=n * 99 // 100),
+            "select median, in_place": lambda: dsaria.sort.select(arr=list(arr), k=n // 2, in_place=True),
+            "partial_sort k=100": lambda: dsaria.sort.partial_sort(arr=arr, k=100),
+            "partial_sort k=n/10": lambda: dsaria.sort.partial_sort(arr=arr, k=n // 10),
+            "partial_sort k=n/10, in_place": lambda: dsaria.sort.partial_sort(arr=list(arr), k=n // 10, in_place=True),
+            "heapq.nsmallest k=n/10": lambda: heapq.nsmallest(n // 10, arr),
+            "partition at median value": lambda: dsaria.sort.partition(arr=list(arr), pivot=0.5),
+            "lazy_sorted first 100": lambda: list(islice(dsaria.sort.lazy_sorted(arr=arr), 100)),
+            "lazy_sorted first n/100": lambda: list(islice(dsaria.sort.lazy_sorted(arr=arr), n // 100)),
+            "lazy_sorted drained": lambda: list(dsaria.sort.lazy_sorted(arr=arr)),
+            "sorted(binary)": lambda: sorted(binary),
+            "select binary, value boundary": lambda: dsaria.sort.select(arr=binary, k=zeros),
+            "partial_sort binary k=n/2": lambda: dsaria.sort.partial_sort(arr=binary, k=n // 2),
+        }
+        baseline = None
+        for name, fn in cases.items():
+            t = _best_of(fn, args.repeat)
+            if baseline is None: baseline = t
+            print(f"{n:>9} {name:<32} {t:>9.4f} {t / baseline:>8.2f}x")
+
+if __name__ == "__main__":
+    main()
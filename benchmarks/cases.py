@@ -0,0 +1,125 @@
+"""
+Benchmark cases for every data structure and algorithm in dsaria.
+
+Each Case builds its input in setup(), outside the timed region, and run() performs the measured
+work on it. Inputs are integers in [0, n) drawn from one of the DISTRIBUTIONS, so every algorithm
+(including counting sort) accepts all of them.
+"""
+import os
+import random
+import tempfile
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional
+
+import dsaria.sort
+from dsaria import validation
+from dsaria.heap import Heap
+from dsaria.linked_list import LinkedList
+from dsaria.order_statistic_tree import OrderStatisticTree
+
+def _noisy(n: int, rng: random.Random) -> List[int]:
+    arr = list(range(n))
+    for _ in range(n // 20): arr[rng.randrange(n)] = rng.randrange(n)
+    return arr
+
+DISTRIBUTIONS: Dict[str, Callable[[int, random.Random], List[int]]] = {
+    "random": lambda n, rng: [rng.randrange(n) for _ in range(n)],
+    "sorted": lambda n, rng: list(range(n)),
+    "reversed": lambda n, rng: list(range(n - 1, -1, -1)),
+    "few_unique": lambda n, rng: [rng.randrange(10) for _ in range(n)],
+    "noisy": _noisy,
+}
+
+@dataclass(frozen=True)
+class Case:
+    """
+    A single benchmark.
+
+    Attributes:
+        name (str): Dotted name, '<module>.<operation>'.
+        setup (Callable[[List[int]], Any]): Builds the state run() needs from the generated input. Not timed.
+        run (Callable[[Any], Any]): The measured work.
+        max_size (Optional[int]): Largest input size to run (for quadratic algorithms), or None.
+        timing_gated (bool): False for cases dominated by file system latency, which can vary several-fold
+            between runs; benchmarks.compare reports their timings but does not count them as regressions.
+    """
+    name: str
+    setup: Callable[[List[int]], Any]
+    run: Callable[[Any], Any]
+    max_size: Optional[int] = None
+    timing_gated: bool = True
+
+def _filled_heap(arr: List[int]) -> Heap:
+    heap = Heap(heap_type="min", val_type=int)
+    for v in arr: heap.insert(val=v)
+    return heap
+
+def _filled_list(arr: List[int]) -> LinkedList:
+    ll = LinkedList(val_type=int, unique_vals=False)
+    for v in sorted(arr, reverse=True): ll.insert(val=v)
+    return ll
+
+def _filled_tree(arr: List[int]) -> OrderStatisticTree:
+    tree = OrderStatisticTree(val_type=int, unique_vals=False)
+    for v in arr: tree.insert(val=v)
+    return tree
+
+def _drain(heap: Heap) -> None:
+    while len(heap): heap.extract_top()
+
+def _insert_all(structure: Any, arr: List[int]) -> None:
+    for v in arr: structure.insert(val=v)
+
+def _with_validation(mode: str, run: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def measured(state: Any) -> Any:
+        with validation.validation(mode): return run(state)
+    return measured
+
+def _write_records(arr: List[int]) -> str:
+    fd, path = tempfile.mkstemp(prefix="dsaria-bench-")
+    with os.fdopen(fd, "wb") as f:
+        for v in arr: f.write(v.to_bytes(8, "big"))
+    return path
+
+def _external_sort(path: str, n: int) -> None:
+    try:
+        # A budget of a quarter of the input forces spilled runs and a k-way merge.
+        for _ in dsaria.sort.external_sort(path=path, record_size=8, memory_limit=max(1024, n * 8 // 4)): pass
+    finally:
+        os.remove(path)
+
+# Always run by benchmarks.suite, so benchmarks.compare has a result besides the compared one in every
+# size and distribution to measure machine speed drift against.
+REFERENCE = "builtin.sorted"
+
+CASES: List[Case] = [
+    Case("heap.insert", lambda arr: (Heap(heap_type="min", val_type=int), arr), lambda s: _insert_all(*s)),
+    Case("heap.extract_top", _filled_heap, _drain),
+    Case("heap.peek_top", _filled_heap, lambda h: [h.peek_top() for _ in range(len(h))]),
+    Case("linked_list.insert", lambda arr: (LinkedList(val_type=int, unique_vals=False), arr), lambda s: _insert_all(*s), max_size=2000),
+    Case("linked_list.search", lambda arr: (_filled_list(arr), arr), lambda s: [s[0].search(v) for v in s[1]], max_size=2000),
+    Case("linked_list.delete", lambda arr: (_filled_list(arr), arr), lambda s: [s[0].delete(val=v) for v in s[1]], max_size=2000),
+    Case("linked_list.len", _filled_list, len, max_size=2000),
+    Case("order_statistic_tree.insert", lambda arr: (OrderStatisticTree(val_type=int, unique_vals=False), arr), lambda s: _insert_all(*s)),
+    Case("order_statistic_tree.rank", lambda arr: (_filled_tree(arr), arr), lambda s: [s[0].rank(val=v) for v in s[1]]),
+    Case("order_statistic_tree.select", _filled_tree, lambda t: [t.select(k=k) for k in range(len(t))]),
+    Case("order_statistic_tree.delete", lambda arr: (_filled_tree(arr), arr), lambda s: [s[0].delete(val=v) for v in s[1]]),
+    Case("sort.bubble_sort", list, lambda a: dsaria.sort.bubble_sort(arr=a), max_size=2000),
+    Case("sort.counting_sort", list, lambda a: dsaria.sort.counting_sort(arr=a)),
+    Case("sort.counting_argsort", list, lambda a: dsaria.sort.counting_argsort(arr=a)),
+    Case("sort.sort", list, lambda a: dsaria.sort.sort(arr=a)),
+    Case("sort.merge_sort", list, lambda a: dsaria.sort.merge_sort(arr=a)),
+    Case("sort.select_median", list, lambda a: dsaria.sort.select(arr=a, k=len(a) // 2)),
+    Case("sort.partial_sort_1pct", list, lambda a: dsaria.sort.partial_sort(arr=a, k=max(1, len(a) // 100))),
+    Case("sort.lazy_sorted_1pct", list, lambda a: list(islice(dsaria.sort.lazy_sorted(arr=a), max(1, len(a) // 100)))),
+    Case("sort.external_sort", lambda arr: (_write_records(arr), len(arr)), lambda s: _external_sort(*s), timing_gated=False),
+    Case("builtin.sorted", list, sorted),
+    # The same work under the cheaper validation modes, to compare against the default ('full') cases above.
+    Case("heap.insert[off]", lambda arr: (Heap(heap_type="min", val_type=int), arr), _with_validation("off", lambda s: _insert_all(*s))),
+    Case("linked_list.insert[off]", lambda arr: (LinkedList(val_type=int, unique_vals=False), arr), _with_validation("off", lambda s: _insert_all(*s)), max_size=2000),
+    Case("sort.bubble_sort[sampled]", list, _with_validation("sampled", lambda a: dsaria.sort.bubble_sort(arr=a)), max_size=2000),
+    Case("sort.bubble_sort[off]", list, _with_validation("off", lambda a: dsaria.sort.bubble_sort(arr=a)), max_size=2000),
+    Case("sort.counting_sort[sampled]", list, _with_validation("sampled", lambda a: dsaria.sort.counting_sort(arr=a))),
+    Case("sort.counting_sort[off]", list, _with_validation("off", lambda a: dsaria.sort.counting_sort(arr=a))),
+]
@@ -0,0 +1,124 @@
+"""
+Compare two benchmark result files written by benchmarks.suite and flag regressions.
+
+Two runs of the suite on unchanged code can differ by 1.5-2x for whole groups of results, because the
+machine itself speeds up or slows down (frequency scaling, throttling, busy neighbours). benchmarks.suite
+interleaves the repeats of all results, so such drift is spread over every case; what remains is
+corrected here: each candidate timing is divided by the median slowdown of the other results with the
+same size and distribution (which always include the builtin.sorted reference), if the candidate run
+was slower at all. Leaving the result itself out of its own median keeps a real regression from
+normalizing itself away; a change that slows every case equally is not flagged, use --raw to compare
+unnormalized timings.
+
+A result then regresses in time only when both its fastest run (min) and the chosen metric (the median,
+p50, by default) grow by more than the threshold relative to the baseline, and by more than an absolute
+noise floor. The median follows the machine's usual speed, the minimum its occasional fast windows;
+requiring both keeps either kind of luck from flagging unchanged code. Timings of cases marked
+timing_gated=False in benchmarks.cases (file system bound) are reported as "slower" but never count as
+regressions. A result also regresses when its peak memory grows by more than the threshold. Results
+present in only one file are listed but never count as regressions. Exits with status 1 if any regression
+is found, so it can gate CI.
+
+With very few repeats (fewer than MIN_REPEAT), a case's samples can all fall in one slow phase of the
+machine, and unchanged code can still be flagged; a warning is printed.
+
+Usage:
+    python -m benchmarks.compare BASELINE.json CANDIDATE.json [--threshold 0.10] [--metric p50_s]
+                                 [--noise-floor 0.0001] [--raw]
+"""
+import argparse
+import json
+import statistics
+import sys
+from typing import Any, Dict, List, Tuple
+
+Key = Tuple[str, int, str]
+
+# Repeats per result below which machine speed phases make comparisons unreliable.
+MIN_REPEAT = 7
+
+def load(path: str) -> Dict[Key, Dict[str, Any]]:
+    """Load a results file, indexed by (case, size, distribution)."""
+    with open(path) as f: report = json.load(f)
+    return {(r["case"], r["size"], r["distribution"]): r for r in report["results"]}
+
+def speed_factors(*, baseline: Dict[Key, Dict[str, Any]], candidate: Dict[Key, Dict[str, Any]], metric: str) -> Dict[Key, float]:
+    """
+    Return, for each result present in both files, the median candidate/baseline ratio of metric over the
+    other results with the same size and distribution: how much slower the machine ran that group in the
+    candidate run. Never below 1.0, and 1.0 when the group has no other result.
+    """
+    groups: Dict[Tuple[int, str], List[Key]] = {}
+    for key in baseline.keys() & candidate.keys(): groups.setdefault(key[1:], []).append(key)
+    factors = {}
+    for members in groups.values():
+        ratios = {k: candidate[k][metric] / baseline[k][metric] for k in members if baseline[k][metric] > 0 and candidate[k][metric] > 0}
+        for key in members:
+            others = [r for k, r in ratios.items() if k != key]
+            # Only slowdowns are corrected: in a faster run, native code (the built-in sort) speeds up less than
+            # interpreted code, so scaling timings up would turn it into false regressions.
+            factors[key] = max(1.0, statistics.median(others)) if others else 1.0
+    return factors
+
+def _slower(*, old: Dict[str, Any], new: Dict[str, Any], metric: str, factor: float, threshold: float, noise_floor: float) -> bool:
+    """Return True if metric, divided by factor, grew by more than threshold (relative) and noise_floor seconds (absolute)."""
+    scaled = new[metric] / factor
+    return scaled > old[metric] * (1 + threshold) and scaled - old[metric] > noise_floor
+
+def compare(*, baseline: Dict[Key, Dict[str, Any]], candidate: Dict[Key, Dict[str, Any]], metric: str, threshold: float, noise_floor: float, normalize: bool = True) -> List[Dict[str, Any]]:
+    """
+    Return one row per result present in both files, with the relative change of the timing metric
+    (normalized for machine speed drift unless normalize is False) and of peak memory, whether it is
+    slower (min and metric both slower beyond the threshold and the noise floor) and whether it
+    regressed: slower and timing gated, or peak memory grown beyond the threshold.
+    """
+    metrics = {"min_s", metric}
+    factors = {m: speed_factors(baseline=baseline, candidate=candidate, metric=m) if normalize else {} for m in metrics}
+    rows = []
+    for key in sorted(baseline.keys() & candidate.keys()):
+        old, new = baseline[key], candidate[key]
+        factor = factors[metric].get(key, 1.0)
+        time_ratio = new[metric] / factor / old[metric] if old[metric] else float("inf")
+        mem_ratio = new["peak_memory_bytes"] / old["peak_memory_bytes"] if old["peak_memory_bytes"] else 1.0
+        slower = all(_slower(old=old, new=new, metric=m, factor=factors[m].get(key, 1.0), threshold=threshold, noise_floor=noise_floor) for m in metrics)
+        rows.append({
+            "key": key,
+            "time_ratio": time_ratio,
+            "memory_ratio": mem_ratio,
+            "slower": slower,
+            "regressed": (slower and new.get("timing_gated", True)) or mem_ratio > 1 + threshold,
+        })
+    return rows
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed relative slowdown or memory growth.")
+    parser.add_argument("--metric", default="p50_s", choices=["min_s", "mean_s", "p50_s", "p90_s", "p99_s"],
+                        help="Timing metric reported and required to regress, together with min_s.")
+    parser.add_argument("--noise-floor", type=float, default=1e-4, help="Ignore timing changes smaller than this many seconds.")
+    parser.add_argument("--raw", action="store_true", help="Compare timings without normalizing for machine speed drift.")
+    args = parser.parse_args()
+
+    baseline, candidate = load(args.baseline), load(args.candidate)
+    rows = compare(baseline=baseline, candidate=candidate, metric=args.metric, threshold=args.threshold,
+                   noise_floor=args.noise_floor, normalize=not args.raw)
+
+    print(f"{'case':<28} {'n':>8} {'distribution':<11} {args.metric:>9} {'memory':>8}")
+    for row in rows:
+        case, size, distribution = row["key"]
+        flag = "  REGRESSION" if row["regressed"] else "  slower (not gated)" if row["slower"] else ""
+        print(f"{case:<28} {size:>8} {distribution:<11} {row['time_ratio']:>8.2f}x {row['memory_ratio']:>7.2f}x{flag}")
+    for key in sorted(baseline.keys() - candidate.keys()): print(f"only in baseline:  {key}")
+    for key in sorted(candidate.keys() - baseline.keys()): print(f"only in candidate: {key}")
+
+    repeat = min((r["repeat"] for r in (*baseline.values(), *candidate.values())), default=MIN_REPEAT)
+    if repeat < MIN_REPEAT:
+        print(f"warning: results with only {repeat} repeats; timings may reflect machine speed phases (use --repeat {MIN_REPEAT} or more).")
+    regressions = sum(row["regressed"] for row in rows)
+    print(f"{regressions} regression(s) out of {len(rows)} compared results (threshold {args.threshold:.0%}).")
+    sys.exit(1 if regressions else 0)
+
+if __name__ == "__main__":
+    main()
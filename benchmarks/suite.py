@@ -0,0 +1,134 @@
+"""
+Run the dsaria benchmark suite and write the results as JSON.
+
+All selected cases run on the same generated input for a given size and distribution, and the timed
+repeats are interleaved across every case, size and distribution (each round runs each of them once,
+on a freshly built copy of the input), so machine speed drift affects all results alike; the suite
+records latency percentiles of each call, throughput (input elements per second at the median
+latency) and peak memory allocated during one extra traced run. builtin.sorted always runs as a
+reference, so benchmarks.compare can tell machine speed drift from regressions even for a single case.
+
+Usage:
+    python -m benchmarks.suite [--output bench_results.json] [--sizes 1000 10000]
+                               [--distributions random sorted] [--cases 'sort.*'] [--repeat 15]
+
+Compare two result files with benchmarks.compare.
+"""
+import argparse
+import fnmatch
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple
+
+from benchmarks.cases import CASES, DISTRIBUTIONS, REFERENCE, Case
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Return the pct-th percentile of samples (nearest-rank method)."""
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+def _time_once(*, case: Case, data: List[int]) -> float:
+    """Time one run of case on a fresh copy of data; setup is not timed."""
+    state = case.setup(list(data))
+    start = time.perf_counter()
+    case.run(state)
+    return time.perf_counter() - start
+
+def _peak_memory(*, case: Case, data: List[int]) -> int:
+    """Return the peak memory allocated during one traced run of case."""
+    state = case.setup(list(data))
+    tracemalloc.start()
+    try:
+        case.run(state)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def measure(*, jobs: List[Tuple[Case, int, str]], repeat: int) -> List[Dict[str, Any]]:
+    """
+    Benchmark every (case, size, distribution) job.
+
+    Cases share one generated input per size and distribution, and the timed runs are interleaved across
+    all jobs: each round times every job once, in a shuffled order. A machine that speeds up or slows down for seconds at a time
+    (frequency scaling, throttling, busy neighbours) then spreads its phases over every job's samples,
+    instead of slowing a contiguous block of jobs.
+    """
+    inputs = {}
+    for _, size, distribution in jobs:
+        if (size, distribution) not in inputs:
+            inputs[size, distribution] = DISTRIBUTIONS[distribution](size, random.Random(f"{size}/{distribution}"))
+
+    timings = [[] for _ in jobs]
+    order = list(range(len(jobs)))
+    shuffle = random.Random("rounds").shuffle
+    for _ in range(repeat):
+        # A fresh order every round keeps a recurring slow phase from always hitting the same jobs.
+        shuffle(order)
+        for i in order:
+            case, size, distribution = jobs[i]
+            timings[i].append(_time_once(case=case, data=inputs[size, distribution]))
+
+    results = []
+    for (case, size, distribution), samples in zip(jobs, timings):
+        p50 = percentile(samples, 50)
+        results.append({
+            "case": case.name,
+            "size": size,
+            "distribution": distribution,
+            "repeat": repeat,
+            "min_s": min(samples),
+            "mean_s": sum(samples) / len(samples),
+            "p50_s": p50,
+            "p90_s": percentile(samples, 90),
+            "p99_s": percentile(samples, 99),
+            "max_s": max(samples),
+            "throughput_per_s": size / p50 if p50 > 0 else float("inf"),
+            "peak_memory_bytes": _peak_memory(case=case, data=inputs[size, distribution]),
+            "timing_gated": case.timing_gated,
+        })
+    return results
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default="bench_results.json", help="Path of the JSON results file.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10_000, 100_000])
+    parser.add_argument("--distributions", nargs="+", choices=sorted(DISTRIBUTIONS), default=sorted(DISTRIBUTIONS))
+    parser.add_argument("--cases", nargs="+", default=["*"], help="Glob patterns selecting case names.")
+    parser.add_argument("--repeat", type=int, default=15, help="Timed runs per case, size and distribution.")
+    args = parser.parse_args()
+
+    cases = [c for c in CASES if any(fnmatch.fnmatchcase(c.name, pattern) for pattern in args.cases)]
+    if not cases: parser.error("no benchmark cases match --cases")
+    cases += [c for c in CASES if c.name == REFERENCE and c not in cases]
+
+    jobs = [(case, size, distribution)
+            for case in cases
+            for size in args.sizes if case.max_size is None or size <= case.max_size
+            for distribution in args.distributions]
+    results = measure(jobs=jobs, repeat=args.repeat)
+    for row in results:
+        print(f"{row['case']:<28} n={row['size']:<8} {row['distribution']:<11} "
+              f"p50={row['p50_s'] * 1e3:9.3f}ms p99={row['p99_s'] * 1e3:9.3f}ms "
+              f"{row['throughput_per_s']:>14,.0f}/s peak={row['peak_memory_bytes'] / 1024:10,.1f}KiB")
+
+    report = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f: json.dump(report, f, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+if __name__ == "__main__":
+    main()
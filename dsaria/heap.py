@@ -1,4 +1,8 @@
-from typing import Any
+from time import perf_counter_ns
+from typing import Any, Optional, Tuple
+
+from dsaria import instrumentation, validation
+from dsaria.instrumentation import OpCounters
 
 class Heap:
     """
@@ -11,10 +15,17 @@ class Heap:
         _arr (List[Any]): Internal array storing heap elements.
         _heap_type (str): Type of heap; either 'min' or 'max'.
         _vt (type): Expected type of elements stored in the heap.
+        _counters (Optional[OpCounters]): Per-instance operation counters.
+        _validate (Optional[str]): Per-instance validation mode.
 
     Properties:
         vt: Returns the expected value type.
         heap_type: Returns whether the heap is a min-heap or max-heap.
+        counters: Per-instance operation counters, or None to use the global instrumentation
+            setting (see dsaria.instrumentation). Settable.
+        validate: Per-instance validation mode ('full', 'sampled' or 'off'), or None to use the
+            library-wide mode (see dsaria.validation). Only 'off' skips the type check of inserted values.
+            Settable; invalid modes are rejected.
 
     Methods:
         parent(idx: int) -> int: Returns the index of the parent of a node.
@@ -27,9 +38,9 @@ class Heap:
         __len__() -> int: Returns the number of elements in the heap.
 
     Raises:
-        TypeError: If inserted value does not match expected type.
+        TypeError: If inserted value does not match expected type (unless validation is off), or counters is not an OpCounters.
         IndexError: If extracting or peeking from an empty heap.
-        ValueError: If heap_type is not 'min' or 'max'.
+        ValueError: If heap_type is not 'min' or 'max', or validate is not a valid validation mode.
     
     Usage:
         >>> h = Heap(heap_type="min", val_type=int)
@@ -42,12 +53,14 @@ class Heap:
         >>> len(h)
         1
     """
-    def __init__(self, *, heap_type: str, val_type: type):
+    def __init__(self, *, heap_type: str, val_type: type, counters: Optional[OpCounters] = None, validate: Optional[str] = None):
         if heap_type not in ["min", "max"]:
             raise ValueError("Heap type must be 'min' or 'max'")
         self._arr = []
         self._heap_type = heap_type
         self._vt = val_type
+        self.counters = counters
+        self.validate = validate
 
     @property
     def vt(self) -> type:
@@ -59,6 +72,25 @@ class Heap:
         """Read-only property for heap type (min/max)."""
         return self._heap_type
 
+    @property
+    def counters(self) -> Optional[OpCounters]:
+        """Per-instance operation counters, or None to use the global instrumentation setting."""
+        return self._counters
+
+    @counters.setter
+    def counters(self, counters: Optional[OpCounters]) -> None:
+        if counters is not None and not isinstance(counters, OpCounters): raise TypeError(f"counters must be an OpCounters or None, got {type(counters).__name__}")
+        self._counters = counters
+
+    @property
+    def validate(self) -> Optional[str]:
+        """Per-instance validation mode, or None to use the library-wide mode."""
+        return self._validate
+
+    @validate.setter
+    def validate(self, mode: Optional[str]) -> None:
+        self._validate = validation.check_mode(mode) if mode is not None else None
+
     @staticmethod
     def parent(idx: int) -> int: 
         """Return the index of the parent of the node at idx."""
@@ -81,6 +113,25 @@ class Heap:
         else:
             return a > b
 
+    def _sift_down(self, idx: int, counting: bool = False) -> Tuple[int, int]:
+        """
+        Move the element at idx down until the heap property holds. Returns (comparisons, swaps) made
+        if counting, else (0, 0).
+        """
+        n = len(self._arr)
+        comparisons = swaps = 0
+        while True:
+            i = idx
+            left_idx = Heap.left(idx)
+            right_idx = Heap.right(idx)
+            if counting: comparisons += (left_idx < n) + (right_idx < n)
+            if left_idx < n and self._compare(a=self._arr[left_idx], b=self._arr[i]): i = left_idx
+            if right_idx < n and self._compare(a=self._arr[right_idx], b=self._arr[i]): i = right_idx
+            if i == idx: return comparisons, swaps
+            self._arr[idx], self._arr[i] = self._arr[i], self._arr[idx]
+            if counting: swaps += 1
+            idx = i
+
     def heapify(self, idx: int):
         """
         Restore the heap property starting from a given index downwards.
@@ -88,18 +139,10 @@ class Heap:
         Args:
             idx (int): Index to start heapifying from.
         """
-        i = idx
-        left_idx = Heap.left(idx)
-        right_idx = Heap.right(idx)
-
-        if (left_idx < len(self._arr)) and (self._compare(a=self._arr[left_idx], b=self._arr[i])):
-            i = left_idx
-        if (right_idx < len(self._arr)) and (self._compare(a=self._arr[right_idx], b=self._arr[i])):
-            i = right_idx
-
-        if i != idx:
-            self._arr[idx], self._arr[i] = self._arr[i], self._arr[idx]
-            self.heapify(idx=i)
+        ctr = instrumentation.resolve(self._counters)
+        if ctr is not None: start = perf_counter_ns()
+        comparisons, swaps = self._sift_down(idx, counting=ctr is not None)
+        if ctr is not None: ctr.record("heap.heapify", comparisons=comparisons, swaps=swaps, elapsed_ns=perf_counter_ns() - start)
 
     def insert(self, val: Any):
         """
@@ -109,15 +152,23 @@ class Heap:
             val (Any): Value to insert.
 
         Raises:
-            TypeError: If val is not of the expected type.
+            TypeError: If val is not of the expected type (unless validation is off).
         """
-        if not isinstance(val, self.vt):
+        ctr = instrumentation.resolve(self._counters)
+        if ctr is not None: start = perf_counter_ns()
+        if validation.resolve(self._validate) != validation.OFF and not isinstance(val, self.vt):
             raise TypeError(f"Expected type {self.vt.__name__}, got {type(val).__name__}")
         self._arr.append(val)
+        counting = ctr is not None
+        swaps = 0
         i = len(self._arr) - 1
         while i > 0 and self._compare(a=self._arr[i], b=self._arr[self.parent(i)]):
             self._arr[i], self._arr[self.parent(i)] = self._arr[self.parent(i)], self._arr[i]
             i = self.parent(i)
+            if counting: swaps += 1
+        if counting:
+            # Every swap was compared once, plus the failed comparison that ended the climb below the root.
+            ctr.record("heap.insert", comparisons=swaps + (i > 0), swaps=swaps, allocations=1, elapsed_ns=perf_counter_ns() - start)
 
     def extract_top(self) -> Any:
         """
@@ -129,13 +180,15 @@ class Heap:
         Raises:
             IndexError: If the heap is empty.
         """
+        ctr = instrumentation.resolve(self._counters)
+        if ctr is not None: start = perf_counter_ns()
         if not self._arr:
             raise IndexError("Heap is empty")
         top = self._arr[0]
         self._arr[0] = self._arr[-1]
         self._arr.pop(-1)
-        if self._arr:
-            self.heapify(idx=0)
+        comparisons, swaps = self._sift_down(0, counting=ctr is not None)
+        if ctr is not None: ctr.record("heap.extract_top", comparisons=comparisons, swaps=swaps, elapsed_ns=perf_counter_ns() - start)
         return top
 
     def peek_top(self) -> Any:
@@ -149,6 +202,8 @@ class Heap:
             IndexError: If the heap is empty.
         """
         if not self._arr: raise IndexError("Heap is empty")
+        ctr = instrumentation.resolve(self._counters)
+        if ctr is not None: ctr.record("heap.peek_top")
         return self._arr[0]
 
     def __len__(self) -> int: 
@@ -0,0 +1,218 @@
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+@dataclass
+class OpStats:
+    """
+    Accumulated counters for one operation (e.g. 'heap.insert').
+
+    Attributes:
+        calls (int): Number of times the operation ran.
+        comparisons (int): Element (or key) comparisons, ordering and equality alike.
+        swaps (int): Element swaps or moves performed by the operation.
+        node_hops (int): Linked nodes visited while walking a structure.
+        allocations (int): Nodes or auxiliary element slots allocated.
+        elapsed_ns (int): Total wall-clock time spent in the operation, in nanoseconds.
+
+    Every operation fills calls and elapsed_ns. The other counters are filled only where listed
+    below and stay 0 elsewhere; in particular, the sort functions other than bubble sort count
+    comparisons but not the element moves or temporary lists of their internals:
+        heap.insert: comparisons, swaps, allocations (the new slot).
+        heap.extract_top, heap.heapify: comparisons, swaps.
+        heap.peek_top: none.
+        linked_list.insert: comparisons, node_hops, allocations (the new node).
+        linked_list.search, linked_list.node_with_val_exists, linked_list.delete: comparisons, node_hops.
+        linked_list.len: node_hops.
+        order_statistic_tree.insert: comparisons, node_hops, allocations (a new node, unless val joins an equal one).
+        order_statistic_tree.search, order_statistic_tree.rank, order_statistic_tree.delete: comparisons, node_hops.
+        order_statistic_tree.select: node_hops.
+        sort.bubble_sort: comparisons, swaps.
+        sort.sort, sort.merge_sort, sort.partition, sort.select, sort.partial_sort, sort.lazy_sorted,
+        sort.external_sort: comparisons (of keys, including those made inside sorted(), bisect and heapq).
+        sort.counting_sort, sort.counting_argsort: none (they make no comparisons).
+    """
+    calls: int = 0
+    comparisons: int = 0
+    swaps: int = 0
+    node_hops: int = 0
+    allocations: int = 0
+    elapsed_ns: int = 0
+
+class OpCounters:
+    """
+    Collects operation counters from instrumented dsaria structures and algorithms.
+
+    Instrumentation is off unless an OpCounters is attached to a structure (the counters=
+    argument or attribute of Heap and LinkedList) or installed globally with enable() or
+    instrumented(). When neither is set, operations pay for one None check per call, plus a test of
+    a local flag per step of the structures' loops; nothing is counted.
+    Per-instance counters take precedence over the global ones.
+
+    Counters are plain integers updated without locking; give each thread its own OpCounters.
+
+    Attributes:
+        ops (Dict[str, OpStats]): Counters per operation name.
+        timer (Optional[Callable[[str, int], None]]): Called after every recorded operation with
+            the operation name and its elapsed time in nanoseconds.
+
+    Methods:
+        record(op, ...): Add one call of op with the given counts.
+        reset(): Clear all counters.
+        summary() -> Dict[str, Dict[str, int]]: Counters per operation, plus a 'total' entry.
+        to_metrics(prefix) -> Dict[str, int]: Flat '<prefix>.<op>.<counter>' mapping for metrics systems.
+
+    Usage:
+        >>> from dsaria.heap import Heap
+        >>> counters = OpCounters()
+        >>> h = Heap(heap_type="min", val_type=int, counters=counters)
+        >>> for v in [5, 3, 1]: h.insert(val=v)
+        >>> counters.summary()["heap.insert"]["swaps"]
+        2
+    """
+    def __init__(self, *, timer: Optional[Callable[[str, int], None]] = None) -> None:
+        self.ops: Dict[str, OpStats] = {}
+        self.timer = timer
+
+    def record(self, op: str, *, comparisons: int = 0, swaps: int = 0, node_hops: int = 0, allocations: int = 0, elapsed_ns: int = 0) -> None:
+        """
+        Add one call of an operation.
+
+        Args:
+            op (str): Operation name, '<module>.<operation>'.
+            comparisons (int): Comparisons performed by the call.
+            swaps (int): Swaps or moves performed by the call.
+            node_hops (int): Nodes visited by the call.
+            allocations (int): Nodes or auxiliary slots allocated by the call.
+            elapsed_ns (int): Wall-clock duration of the call in nanoseconds.
+        """
+        stats = self.ops.get(op)
+        if stats is None: stats = self.ops[op] = OpStats()
+        stats.calls += 1
+        stats.comparisons += comparisons
+        stats.swaps += swaps
+        stats.node_hops += node_hops
+        stats.allocations += allocations
+        stats.elapsed_ns += elapsed_ns
+        if self.timer is not None: self.timer(op, elapsed_ns)
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        self.ops.clear()
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """
+        Return the counters of every recorded operation, plus their sum under 'total'.
+
+        Returns:
+            Dict[str, Dict[str, int]]: Operation name -> counter name -> value.
+        """
+        total = OpStats()
+        out = {}
+        for op, stats in sorted(self.ops.items()):
+            out[op] = asdict(stats)
+            for name, value in out[op].items(): setattr(total, name, getattr(total, name) + value)
+        out["total"] = asdict(total)
+        return out
+
+    def to_metrics(self, prefix: str = "dsaria") -> Dict[str, int]:
+        """
+        Return the summary flattened to '<prefix>.<op>.<counter>' keys, e.g. 'dsaria.heap.insert.comparisons'.
+
+        Args:
+            prefix (str): Prefix for every metric name.
+
+        Returns:
+            Dict[str, int]: Metric name -> value.
+        """
+        return {f"{prefix}.{op}.{name}": value for op, counters in self.summary().items() for name, value in counters.items()}
+
+_global: Optional[OpCounters] = None
+
+def enable(counters: Optional[OpCounters] = None) -> OpCounters:
+    """
+    Turn on instrumentation globally, for every structure without its own counters and every sort function.
+
+    Args:
+        counters (Optional[OpCounters]): Where to record; a new OpCounters if omitted.
+
+    Returns:
+        OpCounters: The counters now receiving records.
+    """
+    global _global
+    _global = counters if counters is not None else OpCounters()
+    return _global
+
+def disable() -> None:
+    """Turn off global instrumentation. Per-instance counters are unaffected."""
+    global _global
+    _global = None
+
+def active() -> Optional[OpCounters]:
+    """Return the globally installed counters, or None if global instrumentation is off."""
+    return _global
+
+def resolve(counters: Optional[OpCounters]) -> Optional[OpCounters]:
+    """Return the per-instance counters if set, otherwise the global ones (or None)."""
+    return counters if counters is not None else _global
+
+@contextmanager
+def instrumented(counters: Optional[OpCounters] = None) -> Iterator[OpCounters]:
+    """
+    Enable global instrumentation for the duration of a with block, restoring the previous state afterwards.
+
+    Usage:
+        >>> import dsaria.sort
+        >>> with instrumented() as counters:
+        ...     _ = dsaria.sort.bubble_sort(arr=[3, 2, 1])
+        >>> counters.summary()["sort.bubble_sort"]["swaps"]
+        3
+    """
+    global _global
+    previous = _global
+    current = enable(counters)
+    try:
+        yield current
+    finally:
+        _global = previous
+
+class CountingKey:
+    """
+    Wraps a comparison key and counts every '<', '<=', '>', '>=' or '==' evaluated on it into a shared tally.
+
+    Used to count the comparisons of key-aware algorithms, including those made inside
+    C code such as sorted(), bisect and heapq, without changing their results.
+    """
+    __slots__ = ("key", "tally")
+
+    def __init__(self, key: Any, tally: List[int]) -> None:
+        self.key = key
+        self.tally = tally
+
+    def __lt__(self, other: "CountingKey") -> bool:
+        self.tally[0] += 1
+        return self.key < other.key
+
+    def __gt__(self, other: "CountingKey") -> bool:
+        self.tally[0] += 1
+        return self.key > other.key
+
+    def __le__(self, other: "CountingKey") -> bool:
+        self.tally[0] += 1
+        return self.key <= other.key
+
+    def __ge__(self, other: "CountingKey") -> bool:
+        self.tally[0] += 1
+        return self.key >= other.key
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CountingKey): return NotImplemented
+        self.tally[0] += 1
+        return self.key == other.key
+
+    __hash__ = None
+
+def counting_key(key: Optional[Callable[[Any], Any]], tally: List[int]) -> Callable[[Any], CountingKey]:
+    """Return a key function producing CountingKey wrappers around key(x) (or x itself if key is None)."""
+    if key is None: return lambda x: CountingKey(x, tally)
+    return lambda x: CountingKey(key(x), tally)
@@ -1,6 +1,10 @@
 from dataclasses import dataclass
+from time import perf_counter_ns
 from typing import Any, Optional
 
+from dsaria import instrumentation, validation
+from dsaria.instrumentation import OpCounters
+
 @dataclass
 class Node:
     """
@@ -29,10 +33,17 @@ class LinkedList:
         head (Optional[Node]): The first node in the list.
         _vt (type): Expected data type of values stored in the list nodes.
         _uv (bool): If True, enforces uniqueness of values in the list.
+        _counters (Optional[OpCounters]): Per-instance operation counters.
+        _validate (Optional[str]): Per-instance validation mode.
 
     Properties:
         vt: Returns the expected value type.
         uv: Returns whether the list enforces unique values.
+        counters: Per-instance operation counters, or None to use the global instrumentation
+            setting (see dsaria.instrumentation). Settable.
+        validate: Per-instance validation mode ('full', 'sampled' or 'off'), or None to use the
+            library-wide mode (see dsaria.validation). Only 'off' skips the type check of values.
+            Settable; invalid modes are rejected.
 
     Methods:
         node_with_val_exists(val: Any) -> bool:
@@ -71,13 +82,15 @@ class LinkedList:
         [5]
 
     Raises:
-        TypeError: When inserted, searched, or deleted values do not match the expected type.
-        ValueError: When attempting to insert duplicate values if unique_vals is True.
+        TypeError: When inserted, searched, or deleted values do not match the expected type (unless validation is off), or counters is not an OpCounters.
+        ValueError: When attempting to insert duplicate values if unique_vals is True, or validate is not a valid validation mode.
     """
-    def __init__(self, *, head: Optional[Node]=None, val_type: type, unique_vals: bool) -> None:
+    def __init__(self, *, head: Optional[Node]=None, val_type: type, unique_vals: bool, counters: Optional[OpCounters]=None, validate: Optional[str]=None) -> None:
         self.head = head
         self._vt = val_type
         self._uv = unique_vals
+        self.counters = counters
+        self.validate = validate
 
     @property
     def vt(self) -> type: return self._vt
@@ -85,6 +98,21 @@ class LinkedList:
     @property
     def uv(self) -> bool: return self._uv
 
+    @property
+    def counters(self) -> Optional[OpCounters]: return self._counters
+
+    @counters.setter
+    def counters(self, counters: Optional[OpCounters]) -> None:
+        if counters is not None and not isinstance(counters, OpCounters): raise TypeError(f"counters must be an OpCounters or None, got {type(counters).__name__}")
+        self._counters = counters
+
+    @property
+    def validate(self) -> Optional[str]: return self._validate
+
+    @validate.setter
+    def validate(self, mode: Optional[str]) -> None:
+        self._validate = validation.check_mode(mode) if mode is not None else None
+
     def node_with_val_exists(self, *, val: Any)->bool:
         """
         Check if a node with the specified value exists in the list.
@@ -96,12 +124,21 @@ class LinkedList:
             bool: True if a node with the value exists, False otherwise.
 
         Raises:
-            TypeError: If val is not of the expected type.
+            TypeError: If val is not of the expected type (unless validation is off).
         """
-        if not isinstance(val, self.vt): raise TypeError(f"Expected type {self.vt.__name__}, got {type(val).__name__}")
-        for node in self: 
-            if node.val == val: return True
-        return False
+        ctr = instrumentation.resolve(self._counters)
+        counting = ctr is not None
+        if counting: start = perf_counter_ns()
+        if validation.resolve(self._validate) != validation.OFF and not isinstance(val, self.vt): raise TypeError(f"Expected type {self.vt.__name__}, got {type(val).__name__}")
+        found = False
+        hops = 0
+        for node in self:
+            if counting: hops += 1
+            if node.val == val:
+                found = True
+                break
+        if counting: ctr.record("linked_list.node_with_val_exists", comparisons=hops, node_hops=hops, elapsed_ns=perf_counter_ns() - start)
+        return found
     
     def search(self, val: Any) -> Optional[Node]:
         """
@@ -114,13 +151,22 @@ class LinkedList:
             Optional[Node]: The node containing the value, or None if not found.
 
         Raises:
-            TypeError: If val is not of the expected type.
+            TypeError: If val is not of the expected type (unless validation is off).
         """
-        if not isinstance(val, self.vt): raise TypeError(f"Expected type {self.vt.__name__}, got {type(val).__name__}")
+        ctr = instrumentation.resolve(self._counters)
+        counting = ctr is not None
+        if counting: start = perf_counter_ns()
+        if validation.resolve(self._validate) != validation.OFF and not isinstance(val, self.vt): raise TypeError(f"Expected type {self.vt.__name__}, got {type(val).__name__}")
+        found = None
+        hops = 0
         for node in self:
-            if node.val == val: return node
-        return None
-    
+            if counting: hops += 1
+            if node.val == val:
+                found = node
+                break
+        if counting: ctr.record("linked_list.search", comparisons=hops, node_hops=hops, elapsed_ns=perf_counter_ns() - start)
+        return found
+
     def __iter__(self):
         current = self.head
         while current:
@@ -135,27 +181,34 @@ class LinkedList:
             val (Any): The value to insert.
 
         Raises:
-            TypeError: If val is not of the expected type.
+            TypeError: If val is not of the expected type (unless validation is off).
             ValueError: If unique_vals is True and val already exists in the list.
         """
-        if not isinstance(val, self.vt): raise TypeError(f"Expected type {self.vt.__name__}, got {type(val).__name__}")
-        if self.uv and self.node_with_val_exists(val=val): raise ValueError(f"Duplicate value '{val}' not allowed in a unique-value list.")
-        if self.head is None: 
-            self.head = Node(val=val)
-            return
-        if val < self.head.val: 
+        if validation.resolve(self._validate) != validation.OFF and not isinstance(val, self.vt): raise TypeError(f"Expected type {self.vt.__name__}, got {type(val).__name__}")
+        ctr = instrumentation.resolve(self._counters)
+        counting = ctr is not None
+        if counting: start = perf_counter_ns()
+        scanned = comparisons = walked = 0
+        if self.uv:
+            for node in self:
+                if counting: scanned += 1
+                if node.val == val: raise ValueError(f"Duplicate value '{val}' not allowed in a unique-value list.")
+        if self.head is None or val < self.head.val:
+            comparisons = self.head is not None
             self.head = Node(val=val, next=self.head)
-            return
-        prev = self.head
-        curr = prev.next
-        while curr:
-            if val > curr.val:
-                curr = curr.next
-                prev = prev.next
-            else:
-                break
-        prev.next = Node(val=val, next=curr)
-        
+        else:
+            prev = self.head
+            curr = prev.next
+            walked = 1
+            while curr is not None and val > curr.val:
+                prev, curr = curr, curr.next
+                if counting: walked += 1
+            prev.next = Node(val=val, next=curr)
+            # One comparison per node walked past, head included, plus the one that stopped the walk.
+            comparisons = walked + (curr is not None)
+        # Every node scanned for a duplicate was compared once too.
+        if counting: ctr.record("linked_list.insert", comparisons=scanned + comparisons, node_hops=scanned + walked, allocations=1, elapsed_ns=perf_counter_ns() - start)
+
     def __repr__(self) -> str:
         nodes = []
         for node in self: nodes.append(str(node.val))
@@ -164,6 +217,8 @@ class LinkedList:
     def __len__(self) -> int:
         count = 0
         for _ in self: count+=1
+        ctr = instrumentation.resolve(self._counters)
+        if ctr is not None: ctr.record("linked_list.len", node_hops=count)
         return count
     
     def to_list(self) -> list:
@@ -185,28 +240,27 @@ class LinkedList:
             val (Any): The value to delete.
 
         Raises:
-            TypeError: If val is not of the expected type.
+            TypeError: If val is not of the expected type (unless validation is off).
         """
-        if not isinstance(val, self.vt): raise TypeError(f"Expected type {self.vt.__name__}, got {type(val).__name__}")
+        if validation.resolve(self._validate) != validation.OFF and not isinstance(val, self.vt): raise TypeError(f"Expected type {self.vt.__name__}, got {type(val).__name__}")
+        ctr = instrumentation.resolve(self._counters)
+        counting = ctr is not None
+        if counting: start = perf_counter_ns()
+        hops = 0
         temp = self.head
         prev = None
         while temp:
-            if prev is None and temp.val == val:
-                temp2 = temp
-                self.head = self.head.next
-                temp = self.head
-                del temp2
-                if self.uv: return
-                continue
-            elif temp.val == val:
-                temp2 = temp
-                prev.next = temp.next
+            # Every node visited is compared once, against val.
+            if counting: hops += 1
+            if temp.val == val:
+                if prev is None: self.head = temp.next
+                else: prev.next = temp.next
                 temp = temp.next
-                del temp2
-                if self.uv: return
+                if self.uv: break
                 continue
             prev = temp
             temp = temp.next
+        if counting: ctr.record("linked_list.delete", comparisons=hops, node_hops=hops, elapsed_ns=perf_counter_ns() - start)
 
     def clear(self) -> None: 
         """Remove all nodes from the list."""
@@ -0,0 +1,443 @@
+from dataclasses import dataclass
+from time import perf_counter_ns
+from typing import Any, Iterator, List, Optional, Tuple
+
+from dsaria import instrumentation, validation
+from dsaria.instrumentation import OpCounters
+
+# Nodes hold references to their children, so the generated field-by-field __eq__ would compare whole subtrees.
+@dataclass(eq=False)
+class TreeNode:
+    """
+    A node in an OrderStatisticTree.
+
+    Attributes:
+        vals (List[Any]): The equal values held, in insertion order (always one in a unique-value tree).
+        left (Optional[TreeNode]): Subtree of smaller values.
+        right (Optional[TreeNode]): Subtree of larger values.
+        height (int): Height of the subtree rooted here (a leaf has height 1).
+        size (int): Number of values in the subtree rooted here, copies included.
+
+    Properties:
+        val: Returns the first value inserted; the other values in vals compare equal to it.
+        count: Returns the number of values held.
+
+    Methods:
+        __repr__(): Returns a string representation of the node's value.
+    """
+    vals: List[Any]
+    left: Optional['TreeNode'] = None
+    right: Optional['TreeNode'] = None
+    height: int = 1
+    size: int = 1
+
+    @property
+    def val(self) -> Any: return self.vals[0]
+
+    @property
+    def count(self) -> int: return len(self.vals)
+
+    def __repr__(self) -> str: return f"{self.val}"
+
+@dataclass(frozen=True, eq=False)
+class TreeEntry:
+    """
+    One stored value, as yielded when iterating an OrderStatisticTree.
+
+    Attributes:
+        val (Any): The stored value.
+        node (TreeNode): The node holding val, together with any values equal to it.
+
+    Methods:
+        __repr__(): Returns a string representation of the value.
+    """
+    val: Any
+    node: TreeNode
+
+    def __repr__(self) -> str: return f"{self.val}"
+
+def _height(node: Optional[TreeNode]) -> int: return node.height if node is not None else 0
+
+def _size(node: Optional[TreeNode]) -> int: return node.size if node is not None else 0
+
+def _update(node: TreeNode) -> None:
+    """Recompute node's height and size from its children."""
+    node.height = 1 + max(_height(node.left), _height(node.right))
+    node.size = len(node.vals) + _size(node.left) + _size(node.right)
+
+def _rotate_left(node: TreeNode) -> TreeNode:
+    top = node.right
+    node.right = top.left
+    top.left = node
+    _update(node)
+    _update(top)
+    return top
+
+def _rotate_right(node: TreeNode) -> TreeNode:
+    top = node.left
+    node.left = top.right
+    top.right = node
+    _update(node)
+    _update(top)
+    return top
+
+def _rebalance(node: TreeNode) -> TreeNode:
+    """Update node and restore the AVL height balance at it; returns the new root of its subtree."""
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right): node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left): node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+def _pop_min(node: TreeNode) -> Tuple[Optional[TreeNode], TreeNode]:
+    """Detach the smallest node of a subtree; returns (the rebalanced subtree, the detached node)."""
+    if node.left is None: return node.right, node
+    node.left, smallest = _pop_min(node.left)
+    return _rebalance(node), smallest
+
+class OrderStatisticTree:
+    """
+    A sorted collection with O(log n) insert, delete, search, rank and select.
+
+    A size-augmented AVL tree: every node also stores the number of values in its subtree, so the
+    position of a value (rank) and the value at a position (select) are found in one root-to-leaf
+    walk instead of the O(n) walk from head a LinkedList needs. It keeps LinkedList's semantics:
+    values are kept in sorted order, type checked against val_type (see dsaria.validation) and,
+    with unique_vals=True, duplicates are rejected. Without it, equal values share one node that
+    keeps each of them in insertion order, so equal but distinct objects are all counted, listed and selected.
+
+    Attributes:
+        root (Optional[TreeNode]): Root of the tree.
+        _vt (type): Expected data type of stored values.
+        _uv (bool): If True, enforces uniqueness of values.
+        _counters (Optional[OpCounters]): Per-instance operation counters.
+        _validate (Optional[str]): Per-instance validation mode.
+
+    Properties:
+        vt: Returns the expected value type.
+        uv: Returns whether the tree enforces unique values.
+        counters: Per-instance operation counters, or None to use the global instrumentation
+            setting (see dsaria.instrumentation). Settable.
+        validate: Per-instance validation mode ('full', 'sampled' or 'off'), or None to use the
+            library-wide mode (see dsaria.validation). Only 'off' skips the type check of values.
+            Settable; invalid modes are rejected.
+
+    Methods:
+        insert(val: Any): Inserts a value.
+        delete(val: Any): Deletes every copy of a value.
+        search(val: Any) -> Optional[TreeNode]: Returns the node holding val and its equals, else None.
+        node_with_val_exists(val: Any) -> bool: Checks if val is stored.
+        rank(val: Any) -> int: Returns the number of stored values smaller than val.
+        select(k: int) -> Any: Returns the k-th smallest value (0-based).
+        to_list() -> list: Returns all values in sorted order.
+        clear(): Removes all values.
+        is_empty() -> bool: Returns True if the tree is empty.
+        __iter__(): Iterates over the stored values in to_list() order, one TreeEntry per value (copies included).
+        __repr__() -> str: Returns the values in order separated by '->'.
+        __len__() -> int: Returns the number of stored values, in O(1).
+
+    Usage:
+        >>> t = OrderStatisticTree(val_type=int, unique_vals=False)
+        >>> for v in [5, 1, 3, 3]: t.insert(val=v)
+        >>> print(t)
+        1->3->3->5
+        >>> t.rank(val=4)
+        3
+        >>> t.select(k=1)
+        3
+        >>> t.delete(val=3)
+        >>> t.to_list()
+        [1, 5]
+
+    Raises:
+        TypeError: When inserted, searched, ranked or deleted values do not match the expected type (unless validation is off), or counters is not an OpCounters.
+        ValueError: When attempting to insert duplicate values if unique_vals is True, or validate is not a valid validation mode.
+        IndexError: When selecting a position outside the tree.
+
+    Time Complexity:
+        insert, delete, search, node_with_val_exists, rank, select: O(log n)
+        __len__, is_empty, clear: O(1)
+        to_list, iteration: O(n)
+    """
+    def __init__(self, *, val_type: type, unique_vals: bool, counters: Optional[OpCounters]=None, validate: Optional[str]=None) -> None:
+        self.root: Optional[TreeNode] = None
+        self._vt = val_type
+        self._uv = unique_vals
+        self.counters = counters
+        self.validate = validate
+
+    @property
+    def vt(self) -> type: return self._vt
+
+    @property
+    def uv(self) -> bool: return self._uv
+
+    @property
+    def counters(self) -> Optional[OpCounters]: return self._counters
+
+    @counters.setter
+    def counters(self, counters: Optional[OpCounters]) -> None:
+        if counters is not None and not isinstance(counters, OpCounters): raise TypeError(f"counters must be an OpCounters or None, got {type(counters).__name__}")
+        self._counters = counters
+
+    @property
+    def validate(self) -> Optional[str]: return self._validate
+
+    @validate.setter
+    def validate(self, mode: Optional[str]) -> None:
+        self._validate = validation.check_mode(mode) if mode is not None else None
+
+    def _check(self, val: Any) -> None:
+        if validation.resolve(self._validate) != validation.OFF and not isinstance(val, self.vt):
+            raise TypeError(f"Expected type {self.vt.__name__}, got {type(val).__name__}")
+
+    def _find(self, val: Any, counting: bool = False) -> Tuple[Optional[TreeNode], int, int]:
+        """
+        Walk from the root to the node holding val. Returns (that node or None, nodes visited, comparisons);
+        the counts are 0 unless counting.
+        """
+        node = self.root
+        hops = seconds = 0
+        while node is not None:
+            if counting: hops += 1
+            if val < node.val:
+                node = node.left
+                continue
+            if counting: seconds += 1
+            if node.val < val: node = node.right
+            else: break
+        # Every node visited is compared once, and a second time unless val went left of it.
+        return node, hops, hops + seconds
+
+    def _rebuild(self, path: List[Tuple[TreeNode, bool]], child: Optional[TreeNode]) -> None:
+        """Reattach child below the last node of path, rebalancing every node of path bottom-up."""
+        for node, went_left in reversed(path):
+            if went_left: node.left = child
+            else: node.right = child
+            child = _rebalance(node)
+        self.root = child
+
+    def insert(self, *, val: Any):
+        """
+        Insert a value, keeping the tree sorted and balanced.
+
+        Args:
+            val (Any): The value to insert.
+
+        Raises:
+            TypeError: If val is not of the expected type (unless validation is off).
+            ValueError: If unique_vals is True and val is already stored.
+        """
+        ctr = instrumentation.resolve(self._counters)
+        counting = ctr is not None
+        if counting: start = perf_counter_ns()
+        self._check(val)
+        path = []
+        node = self.root
+        seconds = 0
+        while node is not None:
+            if val < node.val: went_left = True
+            else:
+                if counting: seconds += 1
+                if node.val < val: went_left = False
+                else:
+                    if self.uv: raise ValueError(f"Duplicate value '{val}' not allowed in a unique-value tree.")
+                    node.vals.append(val)
+                    node.size += 1
+                    for ancestor, _ in path: ancestor.size += 1
+                    if counting: ctr.record("order_statistic_tree.insert", comparisons=len(path) + 1 + seconds, node_hops=len(path) + 1, elapsed_ns=perf_counter_ns() - start)
+                    return
+            path.append((node, went_left))
+            node = node.left if went_left else node.right
+        self._rebuild(path, TreeNode(vals=[val]))
+        # Every node on the path is compared once, and a second time unless val went left of it.
+        if counting: ctr.record("order_statistic_tree.insert", comparisons=len(path) + seconds, node_hops=len(path), allocations=1, elapsed_ns=perf_counter_ns() - start)
+
+    def delete(self, *, val: Any):
+        """
+        Delete every copy of a value. Deleting a value that is not stored does nothing.
+
+        Args:
+            val (Any): The value to delete.
+
+        Raises:
+            TypeError: If val is not of the expected type (unless validation is off).
+        """
+        ctr = instrumentation.resolve(self._counters)
+        counting = ctr is not None
+        if counting: start = perf_counter_ns()
+        self._check(val)
+        path = []
+        node = self.root
+        seconds = 0
+        while node is not None:
+            if val < node.val: went_left = True
+            else:
+                if counting: seconds += 1
+                if node.val < val: went_left = False
+                else: break
+            path.append((node, went_left))
+            node = node.left if went_left else node.right
+        # The walk visits the path and, if val is stored, its node.
+        hops = len(path) + (node is not None)
+        if node is not None:
+            if node.left is None or node.right is None:
+                replacement = node.left if node.left is not None else node.right
+            else:
+                # Two children: the in-order successor takes the node's place.
+                right, replacement = _pop_min(node.right)
+                replacement.left = node.left
+                replacement.right = right
+                replacement = _rebalance(replacement)
+            self._rebuild(path, replacement)
+        if counting: ctr.record("order_statistic_tree.delete", comparisons=hops + seconds, node_hops=hops, elapsed_ns=perf_counter_ns() - start)
+
+    def search(self, val: Any) -> Optional[TreeNode]:
+        """
+        Search for the node holding the specified value.
+
+        Args:
+            val (Any): The value to find.
+
+        Returns:
+            Optional[TreeNode]: The node holding the value, or None if not found.
+
+        Raises:
+            TypeError: If val is not of the expected type (unless validation is off).
+        """
+        ctr = instrumentation.resolve(self._counters)
+        counting = ctr is not None
+        if counting: start = perf_counter_ns()
+        self._check(val)
+        node, hops, comparisons = self._find(val, counting=counting)
+        if counting: ctr.record("order_statistic_tree.search", comparisons=comparisons, node_hops=hops, elapsed_ns=perf_counter_ns() - start)
+        return node
+
+    def node_with_val_exists(self, *, val: Any) -> bool:
+        """
+        Check if the specified value is stored.
+
+        Args:
+            val (Any): The value to search for.
+
+        Returns:
+            bool: True if the value is stored, False otherwise.
+
+        Raises:
+            TypeError: If val is not of the expected type (unless validation is off).
+        """
+        return self.search(val) is not None
+
+    def rank(self, *, val: Any) -> int:
+        """
+        Return the number of stored values (copies included) smaller than val, i.e. the index
+        val has, or would have, in to_list(). val does not need to be stored.
+
+        Args:
+            val (Any): The value to rank.
+
+        Returns:
+            int: Number of stored values less than val.
+
+        Raises:
+            TypeError: If val is not of the expected type (unless validation is off).
+        """
+        ctr = instrumentation.resolve(self._counters)
+        counting = ctr is not None
+        if counting: start = perf_counter_ns()
+        self._check(val)
+        node = self.root
+        smaller = hops = seconds = 0
+        while node is not None:
+            if counting: hops += 1
+            if val < node.val:
+                node = node.left
+                continue
+            if counting: seconds += 1
+            if node.val < val:
+                smaller += _size(node.left) + len(node.vals)
+                node = node.right
+            else:
+                smaller += _size(node.left)
+                break
+        if counting: ctr.record("order_statistic_tree.rank", comparisons=hops + seconds, node_hops=hops, elapsed_ns=perf_counter_ns() - start)
+        return smaller
+
+    def select(self, *, k: int) -> Any:
+        """
+        Return the k-th smallest stored value (0-based, copies included), i.e. to_list()[k]. Equal values
+        are ordered by insertion.
+
+        Args:
+            k (int): Position in sorted order, 0 <= k < len(self).
+
+        Returns:
+            Any: The value at position k.
+
+        Raises:
+            IndexError: If k is out of range.
+        """
+        if not 0 <= k < len(self): raise IndexError(f"k must satisfy 0 <= k < {len(self)}, got {k}")
+        ctr = instrumentation.resolve(self._counters)
+        counting = ctr is not None
+        if counting: start = perf_counter_ns()
+        node = self.root
+        hops = 0
+        while True:
+            if counting: hops += 1
+            left_size = _size(node.left)
+            if k < left_size: node = node.left
+            elif k < left_size + len(node.vals): break
+            else:
+                k -= left_size + len(node.vals)
+                node = node.right
+        if counting: ctr.record("order_statistic_tree.select", node_hops=hops, elapsed_ns=perf_counter_ns() - start)
+        return node.vals[k - left_size]
+
+    def _nodes(self) -> Iterator[TreeNode]:
+        """Yield the nodes in sorted order, once per distinct value."""
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node
+            node = node.right
+
+    def __iter__(self) -> Iterator[TreeEntry]:
+        for node in self._nodes():
+            for val in node.vals: yield TreeEntry(val=val, node=node)
+
+    def to_list(self) -> list:
+        """
+        Convert the tree to a Python list of values.
+
+        Returns:
+            list: Stored values in sorted order, copies included in insertion order.
+        """
+        return [val for node in self._nodes() for val in node.vals]
+
+    def __repr__(self) -> str:
+        nodes = [str(val) for node in self._nodes() for val in node.vals]
+        return "->".join(nodes) if nodes else "Empty"
+
+    def __len__(self) -> int: return _size(self.root)
+
+    def clear(self) -> None:
+        """Remove all values from the tree."""
+        self.root = None
+
+    def is_empty(self) -> bool:
+        """
+        Check if the tree is empty.
+
+        Returns:
+            bool: True if empty, False otherwise.
+        """
+        return self.root is None
@@ -1,18 +1,152 @@
-from typing import List, Any
+import functools
+import heapq
+import inspect
+import logging
+import os
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from contextlib import ExitStack
+from dataclasses import dataclass
+from itertools import compress, islice
+from math import isqrt
+from operator import not_
+from time import perf_counter_ns
+from typing import Any, BinaryIO, Callable, Iterator, List, Optional, Tuple, Union
 
-def bubble_sort(*, arr: List[Any]) -> List[Any]:
+from dsaria import instrumentation, validation
+
+logger = logging.getLogger(__name__)
+
+def _instrumented(op: str, *, count_keys: bool = True) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Record each call of a sort function as op in the global instrumentation counters, if enabled.
+
+    With count_keys, the key (and pivot, if any) is wrapped in instrumentation.CountingKey for the call,
+    which counts every comparison exactly, including those made inside sorted(), bisect and heapq.
+    When instrumentation is off the wrapper adds a single None check per call.
+    """
+    def decorate(fn: Callable[..., Any]) -> Callable[..., Any]:
+        def counted_kwargs(kwargs: dict, tally: List[int]) -> dict:
+            if not count_keys: return kwargs
+            kwargs = dict(kwargs, key=instrumentation.counting_key(kwargs.get("key"), tally))
+            if "pivot" in kwargs: kwargs["pivot"] = instrumentation.CountingKey(kwargs["pivot"], tally)
+            return kwargs
+
+        if inspect.isgeneratorfunction(fn):
+            @functools.wraps(fn)
+            def generator_wrapper(**kwargs: Any) -> Iterator[Any]:
+                ctr = instrumentation.active()
+                if ctr is None:
+                    yield from fn(**kwargs)
+                    return
+                tally = [0]
+                start = perf_counter_ns()
+                try:
+                    yield from fn(**counted_kwargs(kwargs, tally))
+                finally:
+                    ctr.record(op, comparisons=tally[0], elapsed_ns=perf_counter_ns() - start)
+            return generator_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(**kwargs: Any) -> Any:
+            ctr = instrumentation.active()
+            if ctr is None: return fn(**kwargs)
+            tally = [0]
+            start = perf_counter_ns()
+            try:
+                return fn(**counted_kwargs(kwargs, tally))
+            finally:
+                ctr.record(op, comparisons=tally[0], elapsed_ns=perf_counter_ns() - start)
+        return wrapper
+    return decorate
+
+# Element formats (struct/array typecodes) of writable buffers that can be sorted in place.
+_BUFFER_FORMATS = frozenset("bBhHiIlLqQfd")
+_INT_BUFFER_FORMATS = frozenset("bBhHiIlLqQ")
+# Number of buffer elements counted or filled per step, bounding temporary memory on huge buffers.
+_BUFFER_CHUNK = 1 << 16
+
+def _is_buffer(obj: Any) -> bool:
+    """Return True if obj supports the buffer protocol (bytearray, array.array, mmap, NumPy arrays...)."""
+    if isinstance(obj, list): return False
+    try:
+        memoryview(obj).release()
+    except TypeError:
+        return False
+    return True
+
+def _is_read_only(obj: Any) -> bool:
+    """Return True if the buffer obj cannot be written through a memoryview (bytes, read-only mmap...)."""
+    with memoryview(obj) as view: return view.readonly
+
+def _open_buffer(*, buf: Any, stack: ExitStack, writable: bool = True) -> memoryview:
+    """
+    Return a flat memoryview over buf in its native element format, which must be writable unless
+    writable is False. The views are registered on stack so they are released (and buf can be
+    resized or closed again) on exit.
+    """
+    view = stack.enter_context(memoryview(buf))
+    if writable and view.readonly: raise TypeError("Cannot sort a read-only buffer in place.")
+    if view.ndim != 1 or not view.c_contiguous: raise ValueError("Only one-dimensional, contiguous buffers can be sorted.")
+    fmt = view.format.lstrip("@")
+    if fmt not in _BUFFER_FORMATS: raise TypeError(f"Unsupported buffer element format {view.format!r}.")
+    if fmt != view.format: view = stack.enter_context(stack.enter_context(view.cast("B")).cast(fmt))
+    return view
+
+def _copy_into(*, src: Any, dst: Any) -> None:
+    """Copy the elements of src (a list or buffer) into dst (a list, whose contents are replaced, or a buffer of equal length)."""
+    with ExitStack() as stack:
+        src_view = _open_buffer(buf=src, stack=stack, writable=False) if _is_buffer(src) else None
+        if isinstance(dst, list):
+            dst[:] = src if src_view is None else src_view.tolist()
+            return
+        dst_view = _open_buffer(buf=dst, stack=stack)
+        if len(dst_view) != len(src_view if src_view is not None else src): raise ValueError("out must have the same length as arr.")
+        if src_view is None: dst_view[:] = array(dst_view.format, src)
+        elif src_view.format != dst_view.format: raise TypeError("out must have the same element format as arr.")
+        elif dst_view.obj is not src_view.obj: dst_view[:] = src_view
+
+def _bubble(seq: Any, counting: bool = False) -> Tuple[int, int]:
+    """Bubble sort any mutable indexable sequence in place; returns (comparisons, swaps) if counting, else (0, 0)."""
+    n = len(seq)
+    comparisons = swaps = 0
+    for i in range(n):
+        swapped = False
+        if counting: comparisons += n - i - 1
+        for j in range(n - i - 1):
+            if seq[j] > seq[j + 1]:
+                seq[j], seq[j + 1] = seq[j + 1], seq[j]
+                swapped = True
+                if counting: swaps += 1
+        
+        if not swapped: break
+    return comparisons, swaps
+
+def bubble_sort(*, arr: Any, out: Optional[Any] = None) -> Any:
     """
     Sorts a list in ascending order using the bubble sort algorithm.
     Bubble sort swaps adjacent elements if they are in the wrong order.
     The implementation below is optimized so that if no swaps occur in the inner loop,
     the outer loop breaks.
 
+    Writable buffers (bytearray, array.array, mmap, memoryview, NumPy arrays) of integers or floats
+    are sorted in place through a memoryview, without converting them to a list first.
+
     Args:
-        arr (List[Any]): A list of comparable elements. 
+        arr (Any): A list of comparable elements, or a writable one-dimensional buffer.
         If you're passing in a list of objects, make sure that the comparison methods, such as __gt__(self, other), are defined.
+        out (Optional[Any]): Optional destination (a list, or a buffer of the same length and element format).
+        arr is copied into it and the copy is sorted, leaving arr untouched.
 
     Returns:
-        List[Any]: The sorted list in ascending order.
+        Any: The sorted list (or buffer) in ascending order: arr itself, or out if given.
+
+    Raises:
+        TypeError: If list elements are of different types (checked as dsaria.validation's mode requires), or a buffer has an unsupported format or is read-only without out.
+        ValueError: If a buffer is not one-dimensional and contiguous, or out has a different length.
 
     Example:
         >>> bubble_sort([3, 1, 2])
@@ -28,45 +162,142 @@ def bubble_sort(*, arr: List[Any]) -> List[Any]:
         Average case: O(n^2)
 
     """
-    if arr:
-        list_type = type(arr[0])
-        for val in arr:
-            if not isinstance(val, list_type): raise TypeError("All elements in the input array must be the same data type.")
-
-    n = len(arr)
-    for i in range(n):
-        swapped = False
-        for j in range(n - i - 1):
-            if arr[j] > arr[j + 1]:
-                arr[j], arr[j + 1] = arr[j + 1], arr[j]
-                swapped = True
-        
-        if not swapped: break
+    ctr = instrumentation.active()
+    if ctr is not None: start = perf_counter_ns()
+    if out is not None:
+        _copy_into(src=arr, dst=out)
+        arr = out
+    if _is_buffer(arr):
+        # Typed buffers are homogeneous by construction, so no per-element type check is needed.
+        with ExitStack() as stack: comparisons, swaps = _bubble(_open_buffer(buf=arr, stack=stack), counting=ctr is not None)
+    else:
+        if arr:
+            list_type = type(arr[0])
+            for val in validation.to_check(values=arr, mode=validation.get_mode()):
+                if not isinstance(val, list_type): raise TypeError("All elements in the input array must be the same data type.")
+        comparisons, swaps = _bubble(arr, counting=ctr is not None)
 
+    if ctr is not None: ctr.record("sort.bubble_sort", comparisons=comparisons, swaps=swaps, elapsed_ns=perf_counter_ns() - start)
     return arr
 
-def counting_sort(*, arr: List[int]) -> List[int]:
+def _counting_starts(*, keys: List[int], num_vals: int, offset: int = 0, descending: bool = False) -> List[int]:
+    """
+    Count keys into num_vals buckets (bucket = key - offset) and turn the counts into
+    each bucket's first output position via an exclusive prefix sum.
     """
-    Sorts a list of non-negative integers in ascending order using the counting sort algorithm.
+    starts = [0] * num_vals
+    for k in keys: starts[k - offset] += 1
+    total = 0
+    for b in (range(num_vals - 1, -1, -1) if descending else range(num_vals)):
+        c = starts[b]
+        starts[b] = total
+        total += c
+    return starts
+
+def _counting_place(*, items: Any, keys: List[int], num_vals: int, offset: int = 0, descending: bool = False) -> List[Any]:
+    """Stably place each item at its key's next free output position."""
+    starts = _counting_starts(keys=keys, num_vals=num_vals, offset=offset, descending=descending)
+    placed = [None] * len(keys)
+    for item, k in zip(items, keys):
+        b = k - offset
+        placed[starts[b]] = item
+        starts[b] += 1
+    return placed
+
+def _counting_keys(*, arr: List[Any], key: Optional[Callable[[Any], int]]) -> List[int]:
+    """
+    Extract and validate counting sort keys: integers (checked as the validation mode requires), none of them negative.
+    The negativity check always runs, since a negative key would silently index from the end of the count array.
+    """
+    keys = arr if key is None else [key(x) for x in arr]
+    for num in validation.to_check(values=keys, mode=validation.get_mode()):
+        if not isinstance(num, int):
+            raise TypeError("All elements in the input array must be integers." if key is None else "All keys must be integers.")
+    if min(keys) < 0: raise ValueError("Counting sort cannot take negative integers")
+    return keys
+
+def _counting_sort_buffer(*, src: memoryview, dst: memoryview) -> None:
+    """Counting sort an integer buffer view into dst (which may be src), counting and filling in fixed-size chunks."""
+    if src.format not in _INT_BUFFER_FORMATS: raise TypeError("All elements in the input array must be integers.")
+    counts = Counter()
+    for i in range(0, len(src), _BUFFER_CHUNK): counts.update(src[i:i + _BUFFER_CHUNK])
+    if counts and min(counts) < 0: raise ValueError("Counting sort cannot take negative integers")
+    # Runs of one value at least a chunk long are filled from a repeated block; shorter runs are batched
+    # so each write-back converts at most one chunk of values.
+    pos, pending = 0, []
+    for val in sorted(counts):
+        remaining = counts[val]
+        if remaining < _BUFFER_CHUNK:
+            pending += [val] * remaining
+            if len(pending) < _BUFFER_CHUNK: continue
+            remaining = 0
+        if pending:
+            dst[pos:pos + len(pending)] = array(dst.format, pending)
+            pos += len(pending)
+            pending.clear()
+        block = array(dst.format, [val]) * min(remaining, _BUFFER_CHUNK)
+        while remaining:
+            step = min(remaining, len(block))
+            dst[pos:pos + step] = block[:step] if step < len(block) else block
+            pos += step
+            remaining -= step
+    if pending: dst[pos:pos + len(pending)] = array(dst.format, pending)
+
+def _counting_sort_list(*, arr: List[Any], key: Optional[Callable[[Any], int]]) -> List[Any]:
+    """Counting sort a list of non-negative integers, or of records by a non-negative integer key."""
+    if len(arr) == 0: return []
+    keys = _counting_keys(arr=arr, key=key)
+    num_vals = max(keys) + 1
+    if key is not None: return _counting_place(items=arr, keys=keys, num_vals=num_vals)
+
+    count = [0] * num_vals
+    for num in arr: count[num] += 1
+    sorted_arr = []
+    for i in range(len(count)): sorted_arr.extend([i] * count[i])
+    return sorted_arr
+
+@_instrumented("sort.counting_sort", count_keys=False)
+def counting_sort(*, arr: Any, key: Optional[Callable[[Any], int]] = None, out: Optional[Any] = None) -> Any:
+    """
+    Sorts a list of non-negative integers, or records by a non-negative integer key, using the counting sort algorithm.
 
     Counting sort counts the occurrences of each value in the input list and uses
     this information to construct the sorted output. This algorithm is efficient for
     sorting integers when the range of input values is not significantly larger than
     the number of elements.
 
+    When key is given, the counts are turned into each key's starting output position
+    (prefix sums) and whole records are placed there in input order, so records with
+    equal keys keep their relative order.
+
+    Writable integer buffers (bytearray, array.array, mmap, memoryview, NumPy arrays) are sorted in
+    place: occurrences are counted chunk by chunk straight from the buffer and the sorted values are
+    written back in blocks, so no list of the elements is ever built. Read-only buffers (bytes) are
+    only read: they are sorted into out if given, otherwise into a new list.
+
     Args:
-        arr (List[int]): A list of non-negative integers to sort.
+        arr (Any): A list of non-negative integers to sort, or of records if key is given,
+            or a one-dimensional integer buffer.
+        key (Optional[Callable[[Any], int]]): Function returning a non-negative integer key for each record,
+            e.g. a priority or bucket id. Not supported for buffers.
+        out (Optional[Any]): Optional destination for the result (a list, whose contents are replaced, or a
+            buffer of the same length and element format). arr is left untouched.
 
     Returns:
-        List[int]: A new list containing the sorted elements.
+        Any: A new list containing the sorted elements. A writable buffer is sorted in place and returned;
+        if out is given, out is returned.
 
     Raises:
-        TypeError: If any element in the input list is not an integer.
-        ValueError: If any integer in the input list is negative.
+        TypeError: If any element (or key) in the input list is not an integer (checked as dsaria.validation's
+            mode requires), or a buffer has a non-integer format or is combined with key.
+        ValueError: If any integer (or key) in the input list is negative, a buffer is not one-dimensional
+            and contiguous, or out has a different length.
 
     Example:
         >>> counting_sort(arr=[3, 1, 2, 1, 0])
         [0, 1, 1, 2, 3]
+        >>> counting_sort(arr=[("b", 2), ("a", 1), ("c", 2)], key=lambda r: r[1])
+        [('a', 1), ('b', 2), ('c', 2)]
 
     Stable: Yes 
     In-Place: No
@@ -75,18 +306,838 @@ def counting_sort(*, arr: List[int]) -> List[int]:
         O(n + k), where n is the number of elements and k is the range of input values.
 
     Space Complexity:
-        O(k), where k is the range of input values.
+        O(k), where k is the range of input values (plus O(n) for the output when key is given).
         
     """
-    if len(arr) == 0: return arr
-    for num in arr: 
-        if not isinstance(num, int): 
-            raise TypeError("All elements in the input array must be integers.")
-    if min(arr) < 0: raise ValueError("Counting sort cannot take negative integers")
+    # A read-only buffer cannot be sorted in place; without out it is sorted into a new list like any other sequence.
+    if _is_buffer(arr) and (out is not None or not _is_read_only(arr)):
+        if key is not None: raise TypeError("key is not supported when sorting a buffer.")
+        with ExitStack() as stack:
+            src = _open_buffer(buf=arr, stack=stack, writable=out is None)
+            dst = src
+            if isinstance(out, list):
+                if src.format not in _INT_BUFFER_FORMATS: raise TypeError("All elements in the input array must be integers.")
+                out[:] = _counting_sort_list(arr=src.tolist(), key=None)
+                return out
+            if out is not None:
+                dst = _open_buffer(buf=out, stack=stack)
+                if len(dst) != len(src): raise ValueError("out must have the same length as arr.")
+                if dst.format != src.format: raise TypeError("out must have the same element format as arr.")
+            _counting_sort_buffer(src=src, dst=dst)
+        return arr if out is None else out
+    sorted_arr = _counting_sort_list(arr=arr, key=key)
+    if out is None: return sorted_arr
+    _copy_into(src=sorted_arr, dst=out)
+    return out
 
-    num_vals = max(arr) +1 
-    count = [0] * num_vals
-    for num in arr: count[num] += 1
-    sorted_arr = []
-    for i in range(len(count)): sorted_arr.extend([i] * count[i])
-    return sorted_arr
\ No newline at end of file
+@_instrumented("sort.counting_argsort", count_keys=False)
+def counting_argsort(*, arr: List[Any], key: Optional[Callable[[Any], int]] = None) -> List[int]:
+    """
+    Returns the permutation of indices that stably sorts a list by non-negative integer keys.
+
+    This is counting_sort without moving any records: the result p satisfies
+    [arr[i] for i in p] == counting_sort(arr=arr, key=key), so it can be used to
+    reorder several parallel column arrays consistently.
+
+    Args:
+        arr (List[Any]): A list of non-negative integers, or of records if key is given.
+        key (Optional[Callable[[Any], int]]): Function returning a non-negative integer key for each record.
+
+    Returns:
+        List[int]: Indices into arr in sorted order.
+
+    Raises:
+        TypeError: If any element (or key) in the input list is not an integer (checked as dsaria.validation's mode requires).
+        ValueError: If any integer (or key) in the input list is negative.
+
+    Example:
+        >>> priorities = [2, 0, 1, 0]
+        >>> names = ["w", "x", "y", "z"]
+        >>> order = counting_argsort(arr=priorities)
+        >>> order
+        [1, 3, 2, 0]
+        >>> [names[i] for i in order]
+        ['x', 'z', 'y', 'w']
+
+    Stable: Yes
+    In-Place: No
+
+    Time Complexity:
+        O(n + k), where n is the number of elements and k is the range of keys.
+
+    Space Complexity:
+        O(n + k)
+
+    """
+    if len(arr) == 0: return []
+    keys = _counting_keys(arr=arr, key=key)
+    return _counting_place(items=range(len(keys)), keys=keys, num_vals=max(keys) + 1)
+
+
+# Counting sort only beats the built-in sort once the input is large enough to amortize its Python-level passes,
+# and only while the value range stays within a multiple of the input size.
+_COUNTING_MIN_SIZE = 4096
+_COUNTING_MAX_RANGE_FACTOR = 1
+# Number of evenly spaced adjacent pairs inspected before paying for a full presortedness scan.
+_PROFILE_SAMPLE_SIZE = 64
+
+@dataclass(frozen=True)
+class SortStrategy:
+    """
+    The algorithm chosen by sort() for a particular input, and why.
+
+    Attributes:
+        name (str): The chosen strategy: 'trivial', 'presorted', 'reversed', 'counting' or 'timsort'.
+        reason (str): A human-readable explanation of the choice, suitable for logs.
+        size (int): Number of elements in the profiled input.
+    """
+    name: str
+    reason: str
+    size: int
+
+    def __str__(self) -> str: return f"{self.name} (n={self.size}): {self.reason}"
+
+def _sample_pairs(keys: List[Any]) -> List[Tuple[Any, Any]]:
+    """Return up to _PROFILE_SAMPLE_SIZE evenly spaced adjacent pairs of keys."""
+    step = max(1, (len(keys) - 1) // _PROFILE_SAMPLE_SIZE)
+    return [(keys[i], keys[i + 1]) for i in range(0, len(keys) - 1, step)]
+
+def _plan_sort(*, arr: List[Any], key: Optional[Callable[[Any], Any]], reverse: bool, tally: Optional[List[int]] = None) -> Tuple[SortStrategy, List[Any], Optional[Tuple[int, int]]]:
+    """
+    Profile the input and pick a strategy. Also returns the computed keys and, for the 'counting' strategy,
+    the smallest and largest key, so sort() does not recompute them.
+    If tally is given, the key comparisons made while profiling are added to tally[0].
+    """
+    n = len(arr)
+    if n < 2: return SortStrategy(name="trivial", reason="fewer than two elements", size=n), arr, None
+    keys = arr if key is None else [key(x) for x in arr]
+    cmp_keys = keys if tally is None else [instrumentation.CountingKey(k, tally) for k in keys]
+
+    # Presortedness: a cheap sample first, and a full linear scan only when the sample finds no disorder.
+    pairs = _sample_pairs(cmp_keys)
+    if reverse:
+        in_order, opposite = all(a >= b for a, b in pairs), all(a < b for a, b in pairs)
+    else:
+        in_order, opposite = all(a <= b for a, b in pairs), all(a > b for a, b in pairs)
+    if in_order:
+        tail = islice(cmp_keys, 1, None)
+        if all(a >= b for a, b in zip(cmp_keys, tail)) if reverse else all(a <= b for a, b in zip(cmp_keys, tail)):
+            return SortStrategy(name="presorted", reason="input is already in the requested order", size=n), keys, None
+    elif opposite:
+        # Only a strictly opposite order can be reversed without breaking stability.
+        tail = islice(cmp_keys, 1, None)
+        if all(a < b for a, b in zip(cmp_keys, tail)) if reverse else all(a > b for a, b in zip(cmp_keys, tail)):
+            return SortStrategy(name="reversed", reason="input is strictly in the opposite order", size=n), keys, None
+
+    if n >= _COUNTING_MIN_SIZE and all(type(v) is int for v in keys):
+        lo, hi = min(keys), max(keys)
+        if tally is not None: tally[0] += 2 * (n - 1)
+        what = "integers" if key is None else "integer keys"
+        if hi - lo + 1 <= _COUNTING_MAX_RANGE_FACTOR * n:
+            return SortStrategy(name="counting", reason=f"{what} with a small value range ({hi - lo + 1} values)", size=n), keys, (lo, hi)
+        reason = f"{what} value range ({hi - lo + 1} values) is too wide for counting sort"
+    elif n < _COUNTING_MIN_SIZE:
+        reason = "small input; the built-in sort is cheapest"
+    else:
+        reason = "general comparison sort"
+    return SortStrategy(name="timsort", reason=reason, size=n), keys, None
+
+def choose_strategy(*, arr: List[Any], key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> SortStrategy:
+    """
+    Profile an input and report which strategy sort() would use for it, without sorting.
+
+    Args:
+        arr (List[Any]): The input to profile.
+        key (Optional[Callable[[Any], Any]]): Key function, as for sort().
+        reverse (bool): Requested order, as for sort().
+
+    Returns:
+        SortStrategy: The chosen strategy and the reason for choosing it.
+
+    Example:
+        >>> choose_strategy(arr=[1, 2, 3]).name
+        'presorted'
+    """
+    return _plan_sort(arr=arr, key=key, reverse=reverse)[0]
+
+def sort(*, arr: List[Any], key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> List[Any]:
+    """
+    Sorts a list with the cheapest available algorithm for its contents.
+
+    The input is profiled first (size, element type, integer value range and presortedness, the latter from a
+    sample of adjacent pairs) and then dispatched:
+
+        - 'trivial': fewer than two elements; returned as a copy.
+        - 'presorted': already in the requested order; returned as a copy after one linear check.
+        - 'reversed': strictly in the opposite order; returned reversed.
+        - 'counting': large inputs of plain integers (or integer keys) whose value range is at most the input size.
+        - 'timsort': everything else, using Python's built-in sort.
+
+    bubble_sort is never selected: the built-in sort is faster at every input size.
+    The chosen strategy and its reason are logged at DEBUG level on the 'dsaria.sort' logger;
+    choose_strategy() returns the same decision without sorting.
+
+    Args:
+        arr (List[Any]): A list of mutually comparable elements. It is not modified.
+        key (Optional[Callable[[Any], Any]]): Function extracting a comparison key from each element.
+        reverse (bool): If True, sorts in descending order.
+
+    Returns:
+        List[Any]: A new sorted list.
+
+    Raises:
+        TypeError: If the elements (or their keys) cannot be compared with each other.
+
+    Example:
+        >>> sort(arr=[3, 1, 2])
+        [1, 2, 3]
+        >>> sort(arr=["bb", "a", "ccc"], key=len, reverse=True)
+        ['ccc', 'bb', 'a']
+
+    Stable: Yes
+    In-Place: No
+
+    Time Complexity:
+        Best case: O(n) (presorted, reversed or small-range integers)
+        Worst case: O(n log n)
+
+    Space Complexity:
+        O(n)
+
+    """
+    # Instrumented explicitly rather than through _instrumented: wrapping the key would hide integer keys
+    # from the profiler and change the strategy, so the profiling and sorting comparisons are tallied here.
+    ctr = instrumentation.active()
+    tally = None
+    if ctr is not None: start, tally = perf_counter_ns(), [0]
+    strategy, keys, bounds = _plan_sort(arr=arr, key=key, reverse=reverse, tally=tally)
+    logger.debug("sort: chose %s", strategy)
+
+    if strategy.name in ("trivial", "presorted"): sorted_arr = list(arr)
+    elif strategy.name == "reversed": sorted_arr = arr[::-1]
+    elif strategy.name == "counting":
+        lo, hi = bounds
+        if key is not None:
+            sorted_arr = _counting_place(items=arr, keys=keys, num_vals=hi - lo + 1, offset=lo, descending=reverse)
+        else:
+            count = [0] * (hi - lo + 1)
+            for num in keys: count[num - lo] += 1
+            sorted_arr = []
+            for i in range(len(count)): sorted_arr.extend([i + lo] * count[i])
+            if reverse: sorted_arr.reverse()
+    elif tally is not None:
+        order = sorted(range(len(arr)), key=lambda i: instrumentation.CountingKey(keys[i], tally), reverse=reverse)
+        sorted_arr = [arr[i] for i in order]
+    elif key is None: sorted_arr = sorted(arr, reverse=reverse)
+    # Sort positions by the keys already computed while profiling, so key is called once per element.
+    else: sorted_arr = [arr[i] for i in sorted(range(len(arr)), key=keys.__getitem__, reverse=reverse)]
+
+    if ctr is not None: ctr.record("sort.sort", comparisons=tally[0], elapsed_ns=perf_counter_ns() - start)
+    return sorted_arr
+
+# Below this size a segment is finished off with the built-in sort instead of partitioned further.
+_SELECT_CUTOFF = 32
+# Number of evenly spaced keys sampled to choose the pivots of each introselect step.
+_SELECT_SAMPLE = 1024
+# partial_sort keeps a bounded heap instead (heapq.nsmallest) when k is at most this fraction of the input.
+_PARTIAL_HEAP_RATIO = 64
+
+def _median_of_medians(keys: List[Any]) -> Any:
+    """Return the median of the medians of groups of five keys; a pivot guaranteed to discard ~30% of the keys."""
+    medians = [sorted(keys[i:i + 5])[(min(5, len(keys) - i) - 1) // 2] for i in range(0, len(keys), 5)]
+    return _nth_layout(seg=medians, k=len(medians) // 2, keys=None)[len(medians) // 2]
+
+def _split3(*, seg: List[Any], keys: Optional[List[Any]], lo_p: Any, hi_p: Any) -> Tuple[List[Any], List[Any], List[Any]]:
+    """
+    Split seg (elements, or indices into keys) into keys below lo_p, between lo_p and hi_p inclusive,
+    and above hi_p, preserving input order within each group.
+    """
+    if keys is None:
+        return ([x for x in seg if x < lo_p],
+                [x for x in seg if not (x < lo_p or hi_p < x)],
+                [x for x in seg if hi_p < x])
+    return ([i for i in seg if keys[i] < lo_p],
+            [i for i in seg if not (keys[i] < lo_p or hi_p < keys[i])],
+            [i for i in seg if hi_p < keys[i]])
+
+def _nth_layout(*, seg: List[Any], k: int, keys: Optional[List[Any]]) -> List[Any]:
+    """
+    Introselect. Return a permutation of seg (elements, or indices into keys) in which position k holds
+    the element of rank k, every element before it has a key <= its key and every element after it >=.
+
+    Each step sorts an evenly spaced sample of keys and takes two pivots just below and above the sample
+    rank corresponding to k (Floyd-Rivest), so the middle group, which usually contains rank k, is a small
+    fraction of the segment. If two consecutive steps fail to at least halve the segment, median of medians
+    pivots, each guaranteed to discard ~30% of it, are used for the rest of the search. The segment sizes
+    therefore shrink geometrically in every case and the worst case stays linear.
+    """
+    left, right = [], []
+    fallback = False
+    # Segment size at the last progress check, and steps taken since.
+    checked, steps = len(seg), 0
+    done = False
+    while len(seg) > _SELECT_CUTOFF:
+        n = len(seg)
+        if not fallback:
+            sampled = seg[::max(1, n // _SELECT_SAMPLE)]
+            sample = sorted(sampled if keys is None else [keys[i] for i in sampled])
+            r = k * len(sample) // n
+            margin = isqrt(len(sample))
+            lo_p, hi_p = sample[max(0, r - margin)], sample[min(len(sample) - 1, r + margin)]
+            # A key filling a margin's worth of the sample around rank k is heavily duplicated; splitting on it
+            # alone puts rank k in the equal group (and finishes) far more often than a wide pivot pair would.
+            if lo_p == sample[r] or hi_p == sample[r]: lo_p = hi_p = sample[r]
+        else:
+            lo_p = hi_p = _median_of_medians(seg if keys is None else [keys[i] for i in seg])
+        lt, mid, gt = _split3(seg=seg, keys=keys, lo_p=lo_p, hi_p=hi_p)
+        if len(mid) == n and lo_p < hi_p:
+            # Every key lies between the pivots (few distinct values): split on the single sampled key at
+            # rank k instead, which is present in seg and so either holds rank k or shrinks the segment.
+            lo_p = hi_p = sample[r]
+            lt, mid, gt = _split3(seg=seg, keys=keys, lo_p=lo_p, hi_p=hi_p)
+        if k < len(lt):
+            right.append(gt)
+            right.append(mid)
+            seg = lt
+        elif k < len(lt) + len(mid):
+            left.append(lt)
+            right.append(gt)
+            k -= len(lt)
+            seg = mid
+            if not lo_p < hi_p:
+                # Every key in the middle group equals the pivot; it is already in order.
+                done = True
+                break
+        else:
+            left.append(lt)
+            left.append(mid)
+            k -= len(lt) + len(mid)
+            seg = gt
+        steps += 1
+        if steps == 2:
+            if 2 * len(seg) > checked: fallback = True
+            checked, steps = len(seg), 0
+    if not done: seg = sorted(seg, key=None if keys is None else keys.__getitem__)
+
+    out = []
+    for part in left: out.extend(part)
+    out.extend(seg)
+    for part in reversed(right): out.extend(part)
+    return out
+
+def _select_layout(*, arr: List[Any], k: int, key: Optional[Callable[[Any], Any]]) -> List[Any]:
+    """Run introselect on arr and return the rearranged elements."""
+    if key is None: return _nth_layout(seg=arr, k=k, keys=None)
+    keys = [key(x) for x in arr]
+    return [arr[i] for i in _nth_layout(seg=list(range(len(arr))), k=k, keys=keys)]
+
+@_instrumented("sort.partition")
+def partition(*, arr: List[Any], pivot: Any, key: Optional[Callable[[Any], Any]] = None) -> Tuple[int, int]:
+    """
+    Rearranges a list in place around a pivot value (three-way partition).
+
+    Afterwards arr[:lt] holds the elements whose key is less than pivot, arr[lt:gt] those equal
+    to it and arr[gt:] those greater, where (lt, gt) is the returned pair. Each group keeps
+    the relative order it had in the input.
+
+    Args:
+        arr (List[Any]): The list to rearrange.
+        pivot (Any): The value to partition around; compared against each element's key.
+        key (Optional[Callable[[Any], Any]]): Function extracting a comparison key from each element.
+
+    Returns:
+        Tuple[int, int]: The boundaries (lt, gt) of the group equal to pivot.
+
+    Example:
+        >>> arr = [5, 1, 4, 2, 4]
+        >>> partition(arr=arr, pivot=4)
+        (2, 4)
+        >>> arr
+        [1, 2, 4, 4, 5]
+
+    Stable: Yes
+    In-Place: Yes (the input list is rearranged; O(n) auxiliary space is used)
+
+    Time Complexity:
+        O(n)
+
+    Space Complexity:
+        O(n)
+
+    """
+    keys = arr if key is None else [key(x) for x in arr]
+    lt = [x for x, k in zip(arr, keys) if k < pivot]
+    gt = [x for x, k in zip(arr, keys) if pivot < k]
+    eq = [x for x, k in zip(arr, keys) if not (k < pivot or pivot < k)]
+    arr[:] = lt + eq + gt
+    return len(lt), len(lt) + len(eq)
+
+@_instrumented("sort.select")
+def select(*, arr: List[Any], k: int, key: Optional[Callable[[Any], Any]] = None, in_place: bool = False) -> Any:
+    """
+    Returns the element of rank k (0-based) of a list without fully sorting it, using introselect.
+
+    This answers "the k-th smallest", the median (k = len(arr) // 2) or any percentile in expected
+    linear time. With in_place=True the list is also rearranged like C++'s nth_element: arr[k]
+    holds the result, everything before it is <= and everything after it is >=.
+
+    Args:
+        arr (List[Any]): A list of mutually comparable elements.
+        k (int): Rank of the element to return, 0 <= k < len(arr).
+        key (Optional[Callable[[Any], Any]]): Function extracting a comparison key from each element.
+        in_place (bool): If True, rearranges arr as described above; otherwise arr is not modified.
+
+    Returns:
+        Any: The element that sorted(arr, key=key)[k] would return.
+
+    Raises:
+        IndexError: If k is out of range.
+
+    Example:
+        >>> select(arr=[7, 1, 5, 3, 9], k=2)
+        5
+
+    Stable: Yes (ties resolve to the element a stable sort would place at k)
+    In-Place: Optional
+
+    Time Complexity:
+        Average case: O(n)
+        Worst case: O(n)
+
+    Space Complexity:
+        O(n)
+
+    """
+    if not 0 <= k < len(arr): raise IndexError(f"k must satisfy 0 <= k < {len(arr)}, got {k}")
+    layout = _select_layout(arr=arr, k=k, key=key)
+    if in_place: arr[:] = layout
+    return layout[k]
+
+@_instrumented("sort.partial_sort")
+def partial_sort(*, arr: List[Any], k: int, key: Optional[Callable[[Any], Any]] = None, in_place: bool = False) -> List[Any]:
+    """
+    Sorts only the k smallest elements of a list.
+
+    The k smallest elements are found with introselect and only they are sorted, which costs
+    O(n + k log k) instead of O(n log n) for a full sort. When k is tiny compared to the input
+    and a new list is requested, a bounded heap of size k (heapq.nsmallest) is used instead.
+
+    Args:
+        arr (List[Any]): A list of mutually comparable elements.
+        k (int): Number of smallest elements to sort, 0 <= k <= len(arr).
+        key (Optional[Callable[[Any], Any]]): Function extracting a comparison key from each element.
+        in_place (bool): If True, rearranges arr so that arr[:k] holds the k smallest elements in sorted
+            order (the rest in unspecified order) and returns arr. Otherwise arr is not modified and a
+            new list of length k is returned.
+
+    Returns:
+        List[Any]: The k smallest elements in sorted order, or arr itself if in_place is True.
+
+    Raises:
+        ValueError: If k is out of range.
+
+    Example:
+        >>> partial_sort(arr=[9, 4, 7, 1, 8, 2], k=3)
+        [1, 2, 4]
+
+    Stable: Yes
+    In-Place: Optional
+
+    Time Complexity:
+        Average case: O(n + k log k), or O(n log k) on the bounded-heap path
+
+    Space Complexity:
+        O(n)
+
+    """
+    if not 0 <= k <= len(arr): raise ValueError(f"k must satisfy 0 <= k <= {len(arr)}, got {k}")
+    if k == 0: return arr if in_place else []
+    if not in_place and k * _PARTIAL_HEAP_RATIO <= len(arr): return heapq.nsmallest(k, arr, key=key)
+    layout = _select_layout(arr=arr, k=k - 1, key=key)
+    layout[:k] = sorted(layout[:k], key=key)
+    if not in_place: return layout[:k]
+    arr[:] = layout
+    return arr
+
+# lazy_sorted sorts a segment outright (and starts yielding it) once it is no larger than this.
+_LAZY_BLOCK = 256
+
+@_instrumented("sort.lazy_sorted")
+def lazy_sorted(*, arr: List[Any], key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> Iterator[Any]:
+    """
+    Yields the elements of a list in sorted order, doing only as much sorting work as has been consumed.
+
+    This is an incremental quicksort: a stack of unsorted segments is kept, ordered so the next segment to
+    output is on top. The top segment is split at the median of a small sample of its keys, pushing the
+    back half for later, until it is no larger than _LAZY_BLOCK; that block is then sorted and yielded.
+    Back halves are only split once the consumer reaches them, and every split makes one comparison per
+    element. Getting the first element costs about 2n comparisons, and each further element adds an
+    expected O(log m), so reading the first m elements costs expected O(n + m log m). Callers that stop
+    early (pagination, top-k) never pay for a full sort, while draining the iterator still costs O(n log n).
+
+    The input is snapshotted when iteration starts, so later changes to arr do not affect the output.
+
+    Args:
+        arr (List[Any]): A list of mutually comparable elements. It is not modified.
+        key (Optional[Callable[[Any], Any]]): Function extracting a comparison key from each element.
+        reverse (bool): If True, yields elements in descending order.
+
+    Yields:
+        Any: The elements of arr in sorted order.
+
+    Example:
+        >>> from itertools import islice
+        >>> list(islice(lazy_sorted(arr=[5, 3, 9, 1, 7]), 2))
+        [1, 3]
+
+    Stable: Yes
+    In-Place: No
+
+    Time Complexity:
+        First m elements: O(n + m log m) expected
+        Full iteration: O(n log n) expected
+
+    Space Complexity:
+        O(n)
+
+    """
+    items = list(arr)
+    keys = None if key is None else [key(x) for x in items]
+    sort_key = None if keys is None else keys.__getitem__
+    # Each entry is (segment, done); segments hold elements, or indices into keys when key is given.
+    # Done segments hold equal keys and are already in output order.
+    stack = [(items if keys is None else list(range(len(items))), False)]
+    while stack:
+        seg, done = stack.pop()
+        if not done and len(seg) > _LAZY_BLOCK:
+            # About sqrt(n) evenly spaced keys give a pivot close to the median at a cost far below the split.
+            sampled = seg[::len(seg) // isqrt(len(seg))]
+            sample = sorted(sampled if keys is None else [keys[i] for i in sampled], reverse=reverse)
+            pivot = sample[len(sample) // 2]
+            seg_keys = seg if keys is None else [keys[i] for i in seg]
+            # One comparison per element: flag the elements that come before the pivot in output order.
+            if reverse: before = [pivot < k for k in seg_keys]
+            else: before = [k < pivot for k in seg_keys]
+            front = list(compress(seg, before))
+            if front:
+                stack.append((list(compress(seg, map(not_, before))), False))
+                stack.append((front, False))
+                continue
+            # The pivot is the segment's first key in output order; peel off every element with that key.
+            if reverse: after = [k < pivot for k in seg_keys]
+            else: after = [pivot < k for k in seg_keys]
+            back = list(compress(seg, after))
+            if back: stack.append((back, False))
+            stack.append((list(compress(seg, map(not_, after))), True))
+            continue
+        if not done: seg = sorted(seg, key=sort_key, reverse=reverse)
+        if keys is None: yield from seg
+        else: yield from (items[i] for i in seg)
+
+# Merge sort tuning, following CPython's listsort: natural runs shorter than the computed minimum run length
+# are extended with binary insertion, and a merge switches to galloping after _MIN_GALLOP consecutive wins.
+_MIN_MERGE = 64
+_MIN_GALLOP = 7
+
+def _min_run(n: int) -> int:
+    """Return a run length in [_MIN_MERGE / 2, _MIN_MERGE] such that n / run length is close to a power of two."""
+    r = 0
+    while n >= _MIN_MERGE:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+def _gallop_left(keys: List[Any], x: Any, lo: int, hi: int) -> int:
+    """Return the first index in [lo, hi] whose key is not less than x, probing 1, 2, 4... slots from lo first."""
+    prev, ofs = lo, 1
+    while lo + ofs - 1 < hi and keys[lo + ofs - 1] < x:
+        prev = lo + ofs
+        ofs <<= 1
+    return bisect_left(keys, x, prev, min(hi, lo + ofs - 1))
+
+def _gallop_right(keys: List[Any], x: Any, lo: int, hi: int) -> int:
+    """Return the first index in [lo, hi] whose key is greater than x, probing 1, 2, 4... slots from lo first."""
+    prev, ofs = lo, 1
+    while lo + ofs - 1 < hi and not x < keys[lo + ofs - 1]:
+        prev = lo + ofs
+        ofs <<= 1
+    return bisect_right(keys, x, prev, min(hi, lo + ofs - 1))
+
+def _count_run(keys: List[Any], vals: List[Any], lo: int, hi: int) -> int:
+    """Return the end of the natural run starting at lo, reversing it in place if it is strictly descending."""
+    run = lo + 1
+    if run == hi: return hi
+    if keys[run] < keys[lo]:
+        run += 1
+        while run < hi and keys[run] < keys[run - 1]: run += 1
+        keys[lo:run] = keys[lo:run][::-1]
+        if vals is not keys: vals[lo:run] = vals[lo:run][::-1]
+    else:
+        run += 1
+        while run < hi and not keys[run] < keys[run - 1]: run += 1
+    return run
+
+def _binary_insertion(keys: List[Any], vals: List[Any], lo: int, hi: int, start: int) -> None:
+    """Extend the sorted range [lo, start) to [lo, hi) by binary insertion."""
+    for i in range(start, hi):
+        k = keys[i]
+        pos = bisect_right(keys, k, lo, i)
+        if pos == i: continue
+        keys[pos + 1:i + 1] = keys[pos:i]
+        keys[pos] = k
+        if vals is not keys:
+            v = vals[i]
+            vals[pos + 1:i + 1] = vals[pos:i]
+            vals[pos] = v
+
+def _merge(keys: List[Any], vals: List[Any], a: int, b: int, end: int) -> None:
+    """Stably merge the adjacent sorted ranges [a, b) and [b, end) in place, galloping through long streaks."""
+    # Elements of the left run not greater than the right run's first, and elements of the right run not
+    # smaller than the left run's last, are already in their final place.
+    a = _gallop_right(keys, keys[b], a, b)
+    if a == b: return
+    end = _gallop_left(keys, keys[b - 1], b, end)
+    if b == end: return
+
+    paired = vals is not keys
+    tmp_k = keys[a:b]
+    tmp_v = vals[a:b] if paired else tmp_k
+    i, la, j, dest = 0, b - a, b, a
+    wins_a = wins_b = 0
+    while i < la and j < end:
+        if keys[j] < tmp_k[i]:
+            keys[dest] = keys[j]
+            if paired: vals[dest] = vals[j]
+            dest += 1
+            j += 1
+            wins_a, wins_b = 0, wins_b + 1
+            if wins_b >= _MIN_GALLOP:
+                k = _gallop_left(keys, tmp_k[i], j, end)
+                keys[dest:dest + k - j] = keys[j:k]
+                if paired: vals[dest:dest + k - j] = vals[j:k]
+                dest += k - j
+                j, wins_b = k, 0
+        else:
+            keys[dest] = tmp_k[i]
+            if paired: vals[dest] = tmp_v[i]
+            dest += 1
+            i += 1
+            wins_a, wins_b = wins_a + 1, 0
+            if wins_a >= _MIN_GALLOP and j < end:
+                k = _gallop_right(tmp_k, keys[j], i, la)
+                keys[dest:dest + k - i] = tmp_k[i:k]
+                if paired: vals[dest:dest + k - i] = tmp_v[i:k]
+                dest += k - i
+                i, wins_a = k, 0
+    if i < la:
+        keys[dest:dest + la - i] = tmp_k[i:]
+        if paired: vals[dest:dest + la - i] = tmp_v[i:]
+
+def _merge_at(keys: List[Any], vals: List[Any], runs: List[List[int]], idx: int) -> None:
+    """Merge runs[idx] with runs[idx + 1] and record the combined run."""
+    (a, la), (b, lb) = runs[idx], runs[idx + 1]
+    _merge(keys, vals, a, b, b + lb)
+    runs[idx][1] = la + lb
+    del runs[idx + 1]
+
+@_instrumented("sort.merge_sort")
+def merge_sort(*, arr: List[Any], key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> List[Any]:
+    """
+    Sorts a list in place with a natural, run-adaptive merge sort (a simplified Timsort).
+
+    The list is scanned for existing runs: ascending runs are kept and strictly descending runs are
+    reversed in place. Runs shorter than a minimum length (32 to 64, depending on n) are extended with
+    binary insertion sort. Runs are merged through a stack that keeps merges balanced, and each merge
+    first skips the parts of both runs that are already in place, then switches to galloping (exponential
+    plus binary search, copying whole slices) when one run keeps winning. Nearly sorted input therefore
+    costs close to O(n), unlike bubble_sort, which degrades to O(n^2) once a few elements are out of place.
+
+    Args:
+        arr (List[Any]): A list of mutually comparable elements.
+        key (Optional[Callable[[Any], Any]]): Function extracting a comparison key from each element.
+        reverse (bool): If True, sorts in descending order (equal elements keep their input order).
+
+    Returns:
+        List[Any]: The sorted list (arr itself).
+
+    Raises:
+        TypeError: If the elements (or their keys) cannot be compared with each other.
+
+    Example:
+        >>> merge_sort(arr=[1, 2, 3, 7, 4, 5, 6])
+        [1, 2, 3, 4, 5, 6, 7]
+
+    Stable: Yes
+    In-Place: Yes (O(n) temporary space for merges)
+
+    Time Complexity:
+        Best case: O(n) (already sorted, reversed, or a few runs)
+        Worst case: O(n log n)
+        Average case: O(n log n)
+
+    Space Complexity:
+        O(n)
+
+    """
+    n = len(arr)
+    if n < 2: return arr
+    vals = arr
+    keys = arr if key is None else [key(x) for x in arr]
+    # Descending order: sort the reversed list ascending and reverse it back, which keeps ties in input order.
+    if reverse:
+        keys.reverse()
+        if vals is not keys: vals.reverse()
+
+    min_run = _min_run(n)
+    runs = []
+    lo = 0
+    while lo < n:
+        run_end = _count_run(keys, vals, lo, n)
+        if run_end - lo < min_run:
+            forced = min(lo + min_run, n)
+            _binary_insertion(keys, vals, lo, forced, run_end)
+            run_end = forced
+        runs.append([lo, run_end - lo])
+        lo = run_end
+        # Keep pending run lengths balanced: each run must exceed the sum of the next two, and the next one.
+        while len(runs) > 1:
+            i = len(runs) - 2
+            if (i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1]) or (i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1]):
+                if runs[i - 1][1] < runs[i + 1][1]: i -= 1
+            elif runs[i][1] > runs[i + 1][1]:
+                break
+            _merge_at(keys, vals, runs, i)
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if i > 0 and runs[i - 1][1] < runs[i + 1][1]: i -= 1
+        _merge_at(keys, vals, runs, i)
+
+    if reverse:
+        keys.reverse()
+        if vals is not keys: vals.reverse()
+    return arr
+
+
+# Approximate bookkeeping cost of holding one record in memory: the bytes object header plus its list slot.
+_RECORD_OVERHEAD = sys.getsizeof(b"") + 8
+# Maximum number of runs merged at once; more runs are merged in several passes to bound open file handles.
+_MERGE_FAN_IN = 64
+
+def _iter_records(*, f: BinaryIO, record_size: int, buffer_size: int) -> Iterator[bytes]:
+    """Yield fixed-width records from a binary file, reading it in blocks of buffer_size bytes."""
+    while True:
+        block = f.read(buffer_size)
+        if not block: return
+        if len(block) % record_size: raise ValueError(f"Input size is not a multiple of record_size ({record_size} bytes).")
+        for i in range(0, len(block), record_size): yield block[i:i + record_size]
+
+def _merge_runs(*, paths: List[str], record_size: int, buffer_size: int, key: Optional[Callable[[bytes], Any]], reverse: bool) -> Iterator[bytes]:
+    """Lazily k-way merge sorted run files, keeping one read buffer per run."""
+    with ExitStack() as stack:
+        files = [stack.enter_context(open(p, "rb")) for p in paths]
+        yield from heapq.merge(*(_iter_records(f=f, record_size=record_size, buffer_size=buffer_size) for f in files), key=key, reverse=reverse)
+
+def external_sort(
+    *,
+    path: Union[str, os.PathLike],
+    record_size: int,
+    memory_limit: int = 64 * 1024 * 1024,
+    key: Optional[Callable[[bytes], Any]] = None,
+    reverse: bool = False,
+    tmp_dir: Optional[Union[str, os.PathLike]] = None,
+) -> Iterator[bytes]:
+    """
+    Sorts a file of fixed-width binary records that may be larger than memory (external merge sort).
+
+    The input is read in chunks that fit in memory_limit; each chunk is sorted and spilled to a temporary
+    run file. The runs are then k-way merged with buffered reads and the sorted records are yielded one by one,
+    so the output can be streamed to another file or consumed incrementally. If the whole input fits in a
+    single chunk, nothing is written to disk. Temporary files are removed once the iterator is exhausted or closed.
+
+    Arguments are validated and the input file is opened when external_sort is called, so those errors are raised
+    at the call site; the sorting itself only starts when the first record is requested.
+
+    Args:
+        path (str | os.PathLike): Path to the input file. Its size must be a multiple of record_size.
+        record_size (int): Size of each record in bytes.
+        memory_limit (int): Approximate memory budget in bytes for records held in memory at once. Defaults to 64 MiB.
+        key (Optional[Callable[[bytes], Any]]): Function extracting a comparison key from a record. Defaults to the raw bytes.
+        reverse (bool): If True, yields records in descending order.
+        tmp_dir (Optional[str | os.PathLike]): Directory for run files. Defaults to the system temporary directory.
+
+    Returns:
+        Iterator[bytes]: The records of the input file in sorted order.
+
+    Raises:
+        ValueError: If record_size or memory_limit is not positive, or (while iterating) the input size is not a multiple of record_size.
+        OSError: If the input file cannot be opened (e.g. FileNotFoundError).
+
+    Example:
+        >>> with open("sorted.bin", "wb") as out:
+        ...     out.writelines(external_sort(path="data.bin", record_size=16, memory_limit=1 << 28))
+
+    Stable: Yes
+    In-Place: No
+
+    Time Complexity:
+        O(n log n) comparisons, with O(n * log_f(r)) record I/O, where r is the number of runs and f the merge fan-in.
+
+    Space Complexity:
+        O(memory_limit) in memory, O(n) on disk.
+
+    """
+    if record_size <= 0: raise ValueError("record_size must be a positive integer.")
+    if memory_limit <= 0: raise ValueError("memory_limit must be a positive integer.")
+    src = open(path, "rb")
+    return _external_sort_records(src=src, record_size=record_size, memory_limit=memory_limit, key=key, reverse=reverse, tmp_dir=tmp_dir)
+
+@_instrumented("sort.external_sort")
+def _external_sort_records(
+    *,
+    src: BinaryIO,
+    record_size: int,
+    memory_limit: int,
+    key: Optional[Callable[[bytes], Any]],
+    reverse: bool,
+    tmp_dir: Optional[Union[str, os.PathLike]],
+) -> Iterator[bytes]:
+    """Sort the records of the open file src as described in external_sort, closing src when done."""
+    # Each record is held twice while a chunk is split, hence 2 * record_size.
+    run_len = max(1, memory_limit // (2 * record_size + _RECORD_OVERHEAD))
+    # During the merge the budget is shared between one read buffer per run (plus one for the output side).
+    buffer_size = max(1, memory_limit // (_MERGE_FAN_IN + 1) // record_size) * record_size
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir, prefix="dsaria-") as workdir:
+        runs = []
+        with src:
+            while True:
+                chunk = src.read(run_len * record_size)
+                if not chunk: break
+                if len(chunk) % record_size: raise ValueError(f"Input size is not a multiple of record_size ({record_size} bytes).")
+                records = [chunk[i:i + record_size] for i in range(0, len(chunk), record_size)]
+                del chunk
+                records.sort(key=key, reverse=reverse)
+                if not runs and len(records) < run_len:
+                    # The whole input fit in memory; no need to touch the disk.
+                    yield from records
+                    return
+                run_path = os.path.join(workdir, f"run-{len(runs)}")
+                with open(run_path, "wb") as dst: dst.writelines(records)
+                runs.append(run_path)
+                del records
+
+        # Merge in passes of at most _MERGE_FAN_IN runs until a single pass can produce the output.
+        generation = 0
+        while len(runs) > _MERGE_FAN_IN:
+            merged = []
+            for i in range(0, len(runs), _MERGE_FAN_IN):
+                group = runs[i:i + _MERGE_FAN_IN]
+                run_path = os.path.join(workdir, f"merge-{generation}-{len(merged)}")
+                with open(run_path, "wb") as dst:
+                    dst.writelines(_merge_runs(paths=group, record_size=record_size, buffer_size=buffer_size, key=key, reverse=reverse))
+                for p in group: os.remove(p)
+                merged.append(run_path)
+            runs = merged
+            generation += 1
+
+        yield from _merge_runs(paths=runs, record_size=record_size, buffer_size=buffer_size, key=key, reverse=reverse)
@@ -0,0 +1,84 @@
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Sequence
+
+FULL = "full"
+SAMPLED = "sampled"
+OFF = "off"
+MODES = (FULL, SAMPLED, OFF)
+
+# Elements checked by 'sampled' validation of a bulk input, spread evenly across it.
+SAMPLE_SIZE = 64
+
+_global = FULL
+
+def check_mode(mode: str) -> str:
+    """
+    Return mode unchanged if it is a valid validation mode.
+
+    Raises:
+        ValueError: If mode is not 'full', 'sampled' or 'off'.
+    """
+    if mode not in MODES: raise ValueError(f"Validation mode must be one of {', '.join(MODES)}, got {mode!r}")
+    return mode
+
+def set_mode(mode: str) -> None:
+    """
+    Set the library-wide validation mode, used by every sort function and every structure without its own mode.
+
+    Modes:
+        'full' (default): every element or value is type checked.
+        'sampled': bulk inputs (the lists given to bubble_sort and counting_sort) are checked at up to
+            SAMPLE_SIZE evenly spaced elements; single values (Heap.insert, LinkedList operations) are still checked.
+        'off': no type checks. Checks that protect the algorithm itself, such as counting sort
+            rejecting negative integers, always run.
+
+    With 'sampled' or 'off', input that would fail validation is undefined behavior: it may raise a different
+    exception or, for structures, be stored and break ordering later.
+
+    Args:
+        mode (str): 'full', 'sampled' or 'off'.
+
+    Raises:
+        ValueError: If mode is not a valid validation mode.
+    """
+    global _global
+    _global = check_mode(mode)
+
+def get_mode() -> str:
+    """Return the library-wide validation mode."""
+    return _global
+
+def resolve(mode: Optional[str]) -> str:
+    """Return the per-instance mode if set, otherwise the library-wide one."""
+    return mode if mode is not None else _global
+
+@contextmanager
+def validation(mode: str) -> Iterator[str]:
+    """
+    Set the library-wide validation mode for the duration of a with block, restoring the previous mode afterwards.
+
+    Usage:
+        >>> import dsaria.sort
+        >>> with validation("off"):
+        ...     dsaria.sort.bubble_sort(arr=[3, 2, 1])
+        [1, 2, 3]
+    """
+    global _global
+    previous = _global
+    set_mode(mode)
+    try:
+        yield mode
+    finally:
+        _global = previous
+
+def to_check(*, values: Sequence[Any], mode: str) -> Sequence[Any]:
+    """
+    Return the elements of a bulk input that the given mode requires checking: all of them under 'full',
+    up to SAMPLE_SIZE evenly spaced ones (always including the first and last) under 'sampled', none under 'off'.
+    """
+    if mode == FULL: return values
+    if mode == OFF: return ()
+    n = len(values)
+    if n <= SAMPLE_SIZE: return values
+    step = (n - 1) / (SAMPLE_SIZE - 1)
+    return [values[round(i * step)] for i in range(SAMPLE_SIZE)]
@@ -0,0 +1,262 @@
+"""
+Empirical complexity checks for Heap, LinkedList, OrderStatisticTree and dsaria.sort.
+
+Each case runs one operation at geometrically increasing sizes and measures a deterministic cost,
+never wall-clock time, so the checks are stable on loaded machines:
+
+- operation counters from dsaria.instrumentation (comparisons + swaps + node hops + allocations + calls);
+- comparisons made on Probe elements, for code that compares inside C (sorted, heapq);
+- Python lines executed inside dsaria, for code without comparisons (counting sort).
+
+The cost is divided by the documented bound f(n) and a line is fitted to log(cost / f(n)) against log(n).
+A slope near 0 means the operation grows like f(n). An extra log n factor only adds a slope of about
+1 / log(n) over the measured sizes (~0.12 for 1024..16384), so the allowed slope is derived from the sizes:
+a case fails if it grows by LOG_FACTOR_SHARE of a log factor or more, which catches O(n) -> O(n log n),
+O(log n) -> O(log^2 n) and O(1) -> O(log n) regressions as well as polynomial ones.
+"""
+import os
+import random
+import sys
+from array import array
+from dataclasses import dataclass
+from itertools import islice
+from math import log
+from typing import Callable, List
+
+import pytest
+import dsaria
+import dsaria.sort
+from dsaria.heap import Heap
+from dsaria.instrumentation import OpCounters, instrumented
+from dsaria.linked_list import LinkedList, Node
+from dsaria.order_statistic_tree import OrderStatisticTree
+
+# Fraction of the slope an extra log n factor fits to that a case may show before it fails.
+LOG_FACTOR_SHARE = 0.5
+
+_DSARIA_DIR = os.path.dirname(dsaria.__file__)
+
+class Probe:
+    """An int wrapper that counts every comparison made on it."""
+    count = 0
+    __slots__ = ("val",)
+    def __init__(self, val): self.val = val
+    def __lt__(self, other):
+        Probe.count += 1
+        return self.val < other.val
+    def __gt__(self, other):
+        Probe.count += 1
+        return self.val > other.val
+    def __le__(self, other):
+        Probe.count += 1
+        return self.val <= other.val
+    def __ge__(self, other):
+        Probe.count += 1
+        return self.val >= other.val
+
+def _work(counters: OpCounters) -> int:
+    total = counters.summary()["total"]
+    return total["calls"] + total["comparisons"] + total["swaps"] + total["node_hops"] + total["allocations"]
+
+def _counted(run: Callable[[], object]) -> int:
+    """Run with global instrumentation on and return the work recorded."""
+    with instrumented() as counters: run()
+    return _work(counters)
+
+def _probe_comparisons(run: Callable[[], object]) -> int:
+    Probe.count = 0
+    run()
+    return Probe.count
+
+def _dsaria_lines(run: Callable[[], object]) -> int:
+    """Run under a tracer and return the number of Python lines executed in dsaria's own modules."""
+    count = 0
+    def local(frame, event, arg):
+        nonlocal count
+        if event == "line": count += 1
+        return local
+    def tracer(frame, event, arg):
+        return local if frame.f_code.co_filename.startswith(_DSARIA_DIR) else None
+    previous = sys.gettrace()
+    sys.settrace(tracer)
+    try:
+        run()
+    finally:
+        sys.settrace(previous)
+    return count
+
+def _random(n: int) -> List[int]:
+    rng = random.Random(n)
+    return [rng.randrange(n) for _ in range(n)]
+
+def _few_distinct(n: int, distinct: int = 2) -> List[int]:
+    rng = random.Random(n)
+    return [rng.randrange(distinct) for _ in range(n)]
+
+def _select_at_boundary(n: int, distinct: int) -> int:
+    """Select the first occurrence of the middle value, where pivots equal to it split nothing off."""
+    arr = _few_distinct(n, distinct)
+    k = sum(v < distinct // 2 for v in arr)
+    return _counted(lambda: dsaria.sort.select(arr=arr, k=k))
+
+def _linked(values: List[int], *, unique: bool = False) -> LinkedList:
+    """Build a sorted LinkedList directly from nodes, without paying for n sorted inserts."""
+    head = None
+    for v in sorted(values, reverse=True): head = Node(val=v, next=head)
+    return LinkedList(head=head, val_type=int, unique_vals=unique)
+
+def _on_structure(structure, run: Callable[[], object]) -> int:
+    structure.counters = OpCounters()
+    run()
+    return _work(structure.counters)
+
+# Heap operations are measured over a batch of worst-case calls on a heap of size n.
+_BATCH = 32
+
+def _heap(n: int) -> Heap:
+    heap = Heap(heap_type="min", val_type=int)
+    for v in range(n): heap.insert(val=v)
+    return heap
+
+def _heap_insert(n: int) -> int:
+    heap = _heap(n)
+    # Each new minimum sifts all the way up to the root.
+    return _on_structure(heap, lambda: [heap.insert(val=-i) for i in range(1, _BATCH + 1)])
+
+def _heap_extract(n: int) -> int:
+    heap = _heap(n)
+    return _on_structure(heap, lambda: [heap.extract_top() for _ in range(_BATCH)])
+
+def _heap_peek(n: int) -> int:
+    heap = _heap(n)
+    return _on_structure(heap, lambda: [heap.peek_top() for _ in range(_BATCH)])
+
+def _heapify(n: int) -> int:
+    heap = _heap(n)
+    heap._arr[0] = n
+    return _on_structure(heap, lambda: heap.heapify(idx=0))
+
+def _list_op(op: Callable[[LinkedList, int], object], *, unique: bool = False) -> Callable[[int], int]:
+    """Measure op on a sorted list of 0..n-1 with the worst-case argument n (past the tail)."""
+    def measure(n: int) -> int:
+        ll = _linked(list(range(n)), unique=unique)
+        return _on_structure(ll, lambda: op(ll, n))
+    return measure
+
+def _tree_op(op: Callable[[OrderStatisticTree, int], object]) -> Callable[[int], int]:
+    """Measure a batch of op(tree, i) calls on a tree built from the sorted values 0..n-1, its worst insert order for an unbalanced tree."""
+    def measure(n: int) -> int:
+        tree = OrderStatisticTree(val_type=int, unique_vals=True)
+        for v in range(n): tree.insert(val=v)
+        return _on_structure(tree, lambda: [op(tree, i) for i in range(_BATCH)])
+    return measure
+
+@dataclass(frozen=True)
+class Bound:
+    name: str
+    f: Callable[[int], float]
+
+CONSTANT = Bound("O(1)", lambda n: 1)
+LOGARITHMIC = Bound("O(log n)", lambda n: log(n))
+LINEAR = Bound("O(n)", lambda n: n)
+LINEARITHMIC = Bound("O(n log n)", lambda n: n * log(n))
+QUADRATIC = Bound("O(n^2)", lambda n: n * n)
+
+@dataclass(frozen=True)
+class Complexity:
+    """
+    One complexity check.
+
+    Attributes:
+        name (str): Test id, '<module>.<operation>[input]'.
+        bound (Bound): Documented growth bound.
+        measure (Callable[[int], int]): Deterministic cost of the operation at size n.
+        sizes (List[int]): Input sizes, growing geometrically.
+    """
+    name: str
+    bound: Bound
+    measure: Callable[[int], int]
+    sizes: List[int]
+
+_SMALL = [128, 256, 512, 1024, 2048, 4096, 8192]
+_LARGE = [1024, 2048, 4096, 8192, 16384]
+
+CASES = [
+    Complexity("heap.insert[new minimum]", LOGARITHMIC, _heap_insert, _LARGE),
+    Complexity("heap.extract_top", LOGARITHMIC, _heap_extract, _LARGE),
+    Complexity("heap.peek_top", CONSTANT, _heap_peek, _LARGE),
+    Complexity("heap.heapify[root]", LOGARITHMIC, _heapify, _LARGE),
+    Complexity("linked_list.insert[tail]", LINEAR, _list_op(lambda ll, n: ll.insert(val=n)), _SMALL),
+    Complexity("linked_list.insert[unique, tail]", LINEAR, _list_op(lambda ll, n: ll.insert(val=n), unique=True), _SMALL),
+    Complexity("linked_list.insert[head]", CONSTANT, _list_op(lambda ll, n: ll.insert(val=-1)), _SMALL),
+    Complexity("linked_list.search[missing]", LINEAR, _list_op(lambda ll, n: ll.search(n)), _SMALL),
+    Complexity("linked_list.node_with_val_exists[missing]", LINEAR, _list_op(lambda ll, n: ll.node_with_val_exists(val=n)), _SMALL),
+    Complexity("linked_list.delete[missing]", LINEAR, _list_op(lambda ll, n: ll.delete(val=n)), _SMALL),
+    Complexity("linked_list.len", LINEAR, _list_op(lambda ll, n: len(ll)), _SMALL),
+    Complexity("order_statistic_tree.insert[new maximum]", LOGARITHMIC, _tree_op(lambda t, i: t.insert(val=len(t))), _LARGE),
+    Complexity("order_statistic_tree.delete[minimum]", LOGARITHMIC, _tree_op(lambda t, i: t.delete(val=i)), _LARGE),
+    Complexity("order_statistic_tree.search[missing]", LOGARITHMIC, _tree_op(lambda t, i: t.search(-1)), _LARGE),
+    Complexity("order_statistic_tree.rank[past the end]", LOGARITHMIC, _tree_op(lambda t, i: t.rank(val=len(t))), _LARGE),
+    Complexity("order_statistic_tree.select[last]", LOGARITHMIC, _tree_op(lambda t, i: t.select(k=len(t) - 1)), _LARGE),
+    Complexity("sort.bubble_sort[random]", QUADRATIC, lambda n: _counted(lambda: dsaria.sort.bubble_sort(arr=_random(n))), [64, 128, 256, 512]),
+    Complexity("sort.bubble_sort[sorted]", LINEAR, lambda n: _counted(lambda: dsaria.sort.bubble_sort(arr=list(range(n)))), _LARGE),
+    Complexity("sort.counting_sort[random]", LINEAR, lambda n: _dsaria_lines(lambda: dsaria.sort.counting_sort(arr=_random(n))), _LARGE),
+    Complexity("sort.counting_sort[key]", LINEAR, lambda n: _dsaria_lines(lambda: dsaria.sort.counting_sort(arr=_random(n), key=lambda v: v)), _LARGE),
+    Complexity("sort.counting_sort[buffer]", LINEAR, lambda n: _dsaria_lines(lambda: dsaria.sort.counting_sort(arr=array("q", _random(n)))), _LARGE),
+    Complexity("sort.counting_argsort", LINEAR, lambda n: _dsaria_lines(lambda: dsaria.sort.counting_argsort(arr=_random(n))), _LARGE),
+    Complexity("sort.sort[random]", LINEARITHMIC, lambda n: _probe_comparisons(lambda: dsaria.sort.sort(arr=[Probe(v) for v in _random(n)])), _LARGE),
+    Complexity("sort.sort[sorted]", LINEAR, lambda n: _probe_comparisons(lambda: dsaria.sort.sort(arr=[Probe(v) for v in range(n)])), _LARGE),
+    Complexity("sort.merge_sort[random]", LINEARITHMIC, lambda n: _counted(lambda: dsaria.sort.merge_sort(arr=_random(n))), _LARGE),
+    Complexity("sort.merge_sort[sorted]", LINEAR, lambda n: _counted(lambda: dsaria.sort.merge_sort(arr=list(range(n)))), _LARGE),
+    Complexity("sort.merge_sort[reversed]", LINEAR, lambda n: _counted(lambda: dsaria.sort.merge_sort(arr=list(range(n, 0, -1)))), _LARGE),
+    Complexity("sort.select[median]", LINEAR, lambda n: _counted(lambda: dsaria.sort.select(arr=_random(n), k=n // 2)), _LARGE),
+    Complexity("sort.select[sorted]", LINEAR, lambda n: _counted(lambda: dsaria.sort.select(arr=list(range(n)), k=n // 2)), _LARGE),
+    Complexity("sort.select[binary, value boundary]", LINEAR, lambda n: _select_at_boundary(n, 2), _LARGE),
+    Complexity("sort.select[3 values, value boundary]", LINEAR, lambda n: _select_at_boundary(n, 3), _LARGE),
+    Complexity("sort.select[binary, median]", LINEAR, lambda n: _counted(lambda: dsaria.sort.select(arr=_few_distinct(n), k=n // 2)), _LARGE),
+    Complexity("sort.partition", LINEAR, lambda n: _counted(lambda: dsaria.sort.partition(arr=_random(n), pivot=n // 2)), _LARGE),
+    Complexity("sort.partial_sort[k=10]", LINEAR, lambda n: _counted(lambda: dsaria.sort.partial_sort(arr=_random(n), k=10)), _LARGE),
+    Complexity("sort.partial_sort[k=10, in_place]", LINEAR, lambda n: _counted(lambda: dsaria.sort.partial_sort(arr=_random(n), k=10, in_place=True)), _LARGE),
+    Complexity("sort.lazy_sorted[first 10]", LINEAR, lambda n: _counted(lambda: list(islice(dsaria.sort.lazy_sorted(arr=_random(n)), 10))), _LARGE),
+    Complexity("sort.lazy_sorted[all]", LINEARITHMIC, lambda n: _counted(lambda: list(dsaria.sort.lazy_sorted(arr=_random(n)))), _LARGE),
+]
+
+def growth_exponent(*, sizes: List[int], costs: List[int], bound: Bound) -> float:
+    """Least-squares slope of log(cost / f(n)) against log(n): how much faster than f(n) the cost grows."""
+    xs = [log(n) for n in sizes]
+    ys = [log(c / bound.f(n)) for n, c in zip(sizes, costs)]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sum((x - mx) ** 2 for x in xs)
+
+def tolerance(sizes: List[int]) -> float:
+    """Largest growth exponent allowed over sizes: LOG_FACTOR_SHARE of the exponent an extra log n factor fits to."""
+    return LOG_FACTOR_SHARE * growth_exponent(sizes=sizes, costs=[log(n) for n in sizes], bound=CONSTANT)
+
+@pytest.mark.parametrize("case", CASES, ids=[c.name for c in CASES])
+def test_growth_within_documented_bound(case):
+    costs = [case.measure(n) for n in case.sizes]
+    exponent = growth_exponent(sizes=case.sizes, costs=costs, bound=case.bound)
+    assert exponent <= tolerance(case.sizes), (
+        f"{case.name} grows like {case.bound.name} * n^{exponent:.2f} (allowed n^{tolerance(case.sizes):.2f}); "
+        f"costs {dict(zip(case.sizes, costs))}"
+    )
+
+@pytest.mark.parametrize("bound, sizes", [
+    (CONSTANT, _SMALL), (CONSTANT, _LARGE),
+    (LOGARITHMIC, _LARGE),
+    (LINEAR, _SMALL), (LINEAR, _LARGE),
+    (LINEARITHMIC, _LARGE),
+    (QUADRATIC, [64, 128, 256, 512]),
+])
+@pytest.mark.parametrize("extra", [
+    Bound("n", lambda n: n),
+    Bound("log n", lambda n: log(n)),
+], ids=lambda b: b.name)
+def test_harness_detects_faster_growth(bound, sizes, extra):
+    costs = [round(bound.f(n) * extra.f(n) * 100) for n in sizes]
+    assert growth_exponent(sizes=sizes, costs=costs, bound=bound) > tolerance(sizes)
+
+@pytest.mark.parametrize("bound, sizes", [(CONSTANT, _SMALL), (LOGARITHMIC, _LARGE), (LINEAR, _LARGE), (LINEARITHMIC, _LARGE)])
+def test_harness_accepts_documented_growth_with_lower_order_terms(bound, sizes):
+    costs = [round(3 * bound.f(n) + 50) for n in sizes]
+    assert growth_exponent(sizes=sizes, costs=costs, bound=bound) <= tolerance(sizes)
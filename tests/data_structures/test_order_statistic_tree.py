@@ -0,0 +1,201 @@
+import pytest
+import random
+from bisect import bisect_left
+from dsaria import validation
+from dsaria.instrumentation import OpCounters
+from dsaria.order_statistic_tree import OrderStatisticTree
+
+def assert_balanced(node):
+    """Check AVL balance, cached heights and sizes; returns (height, size)."""
+    if node is None: return 0, 0
+    lh, ls = assert_balanced(node.left)
+    rh, rs = assert_balanced(node.right)
+    assert abs(lh - rh) <= 1
+    assert node.height == 1 + max(lh, rh)
+    assert node.size == node.count + ls + rs
+    return node.height, node.size
+
+def test_insert_keeps_sorted_order():
+    t = OrderStatisticTree(val_type=int, unique_vals=False)
+    for v in [5, 3, 7, 3]: t.insert(val=v)
+    assert t.to_list() == [3, 3, 5, 7]
+    assert len(t) == 4
+    assert repr(t) == "3->3->5->7"
+
+def test_empty_tree():
+    t = OrderStatisticTree(val_type=int, unique_vals=True)
+    assert t.is_empty()
+    assert len(t) == 0
+    assert repr(t) == "Empty"
+    assert t.to_list() == []
+    assert t.rank(val=3) == 0
+    assert t.search(1) is None
+    t.delete(val=1)
+
+def test_insert_duplicate_raises_value_error_if_unique():
+    t = OrderStatisticTree(val_type=int, unique_vals=True)
+    t.insert(val=1)
+    with pytest.raises(ValueError):
+        t.insert(val=1)
+    assert len(t) == 1
+
+@pytest.mark.parametrize("call", [
+    lambda t: t.insert(val="a"),
+    lambda t: t.delete(val="a"),
+    lambda t: t.search("a"),
+    lambda t: t.node_with_val_exists(val="a"),
+    lambda t: t.rank(val="a"),
+])
+def test_wrong_type_raises_type_error(call):
+    t = OrderStatisticTree(val_type=int, unique_vals=False)
+    t.insert(val=1)
+    with pytest.raises(TypeError):
+        call(t)
+
+def test_validation_off_skips_type_checks():
+    t = OrderStatisticTree(val_type=int, unique_vals=False, validate="off")
+    t.insert(val=1.5)
+    t.insert(val=1)
+    assert t.to_list() == [1, 1.5]
+    with validation.validation("off"):
+        OrderStatisticTree(val_type=int, unique_vals=False).insert(val=2.5)
+    with pytest.raises(ValueError):
+        OrderStatisticTree(val_type=int, unique_vals=False, validate="never")
+
+def test_search_and_exists():
+    t = OrderStatisticTree(val_type=int, unique_vals=True)
+    for v in range(10): t.insert(val=v)
+    assert t.search(4).val == 4
+    assert t.search(10) is None
+    assert t.node_with_val_exists(val=9) is True
+    assert t.node_with_val_exists(val=-1) is False
+
+def test_rank_and_select_with_duplicates():
+    t = OrderStatisticTree(val_type=int, unique_vals=False)
+    for v in [4, 2, 2, 8, 6, 2]: t.insert(val=v)
+    assert [t.rank(val=v) for v in [1, 2, 3, 4, 5, 8, 9]] == [0, 0, 3, 3, 4, 5, 6]
+    assert [t.select(k=k) for k in range(len(t))] == [2, 2, 2, 4, 6, 8]
+
+@pytest.mark.parametrize("k", [-1, 3])
+def test_select_out_of_range(k):
+    t = OrderStatisticTree(val_type=int, unique_vals=True)
+    for v in range(3): t.insert(val=v)
+    with pytest.raises(IndexError):
+        t.select(k=k)
+
+def test_delete_removes_all_copies():
+    t = OrderStatisticTree(val_type=int, unique_vals=False)
+    for v in [1, 2, 2, 2, 3]: t.insert(val=v)
+    t.delete(val=2)
+    assert t.to_list() == [1, 3]
+    assert len(t) == 2
+    assert_balanced(t.root)
+
+def test_iteration_yields_one_entry_per_value():
+    t = OrderStatisticTree(val_type=int, unique_vals=False)
+    for v in [3, 1, 3, 2]: t.insert(val=v)
+    assert [entry.val for entry in t] == t.to_list() == [1, 2, 3, 3]
+    assert len(list(t)) == len(t)
+    assert [entry.node.count for entry in t] == [1, 1, 2, 2]
+
+class Keyed:
+    """Ordered and compared by key only, so objects with different payloads are equal."""
+    def __init__(self, key, payload): self.key, self.payload = key, payload
+    def __lt__(self, other): return self.key < other.key
+    def __eq__(self, other): return self.key == other.key
+
+def test_equal_but_distinct_objects_are_all_kept():
+    t = OrderStatisticTree(val_type=Keyed, unique_vals=False)
+    a, b, c, d = Keyed(1, "a"), Keyed(0, "b"), Keyed(1, "c"), Keyed(1, "d")
+    for v in [a, b, c, d]: t.insert(val=v)
+    assert [v.payload for v in t.to_list()] == ["b", "a", "c", "d"]
+    assert all(t.select(k=k) is v for k, v in enumerate([b, a, c, d]))
+    assert t.search(Keyed(1, "x")).val is a
+    assert t.rank(val=Keyed(2, "x")) == 4
+    assert all(entry.val is v for entry, v in zip(t, [b, a, c, d]))
+
+def test_clear():
+    t = OrderStatisticTree(val_type=int, unique_vals=False)
+    t.insert(val=1)
+    t.clear()
+    assert t.is_empty()
+    assert len(t) == 0
+
+@pytest.mark.parametrize("unique", [True, False])
+def test_matches_sorted_list_under_random_operations(unique):
+    rng = random.Random(7)
+    t = OrderStatisticTree(val_type=int, unique_vals=unique)
+    model = []
+    for _ in range(3000):
+        v = rng.randrange(200)
+        if rng.random() < 0.6:
+            if unique and v in model:
+                with pytest.raises(ValueError):
+                    t.insert(val=v)
+            else:
+                t.insert(val=v)
+                model.insert(bisect_left(model, v), v)
+        else:
+            t.delete(val=v)
+            model = [x for x in model if x != v]
+        assert len(t) == len(model)
+        assert t.rank(val=v) == bisect_left(model, v)
+        if model:
+            k = rng.randrange(len(model))
+            assert t.select(k=k) == model[k]
+    assert t.to_list() == model
+    assert_balanced(t.root)
+
+def test_height_stays_logarithmic_on_sorted_inserts():
+    t = OrderStatisticTree(val_type=int, unique_vals=True)
+    for v in range(4096): t.insert(val=v)
+    assert_balanced(t.root)
+    assert t.root.height <= 1.45 * 12 + 1
+    for v in range(0, 4096, 2): t.delete(val=v)
+    assert t.to_list() == list(range(1, 4096, 2))
+    assert_balanced(t.root)
+
+def test_counters_record_operations():
+    counters = OpCounters()
+    t = OrderStatisticTree(val_type=int, unique_vals=False, counters=counters)
+    for v in [2, 1, 3, 3]: t.insert(val=v)
+    t.rank(val=3)
+    t.select(k=0)
+    t.search(1)
+    t.delete(val=3)
+    summary = counters.summary()
+    assert summary["order_statistic_tree.insert"]["calls"] == 4
+    assert summary["order_statistic_tree.insert"]["allocations"] == 3
+    # rank(3) from root 2: right (2 comparisons), then equal at 3 (2 comparisons).
+    assert summary["order_statistic_tree.rank"]["comparisons"] == 4
+    assert summary["order_statistic_tree.select"]["node_hops"] == 2
+    assert summary["order_statistic_tree.delete"]["node_hops"] == 2
+
+def test_counted_comparisons_match_actual_ones():
+    compared = [0]
+    class Counted(Keyed):
+        def __lt__(self, other):
+            compared[0] += 1
+            return self.key < other.key
+    rng = random.Random(3)
+    values = [Counted(rng.randrange(100), i) for i in range(300)]
+    plain = OrderStatisticTree(val_type=Counted, unique_vals=False)
+    counters = OpCounters()
+    traced = OrderStatisticTree(val_type=Counted, unique_vals=False, counters=counters)
+    ops = [
+        (lambda t, v: t.insert(val=v), values),
+        (lambda t, v: t.rank(val=v), values[::3]),
+        (lambda t, v: t.search(v), values[1::7]),
+        (lambda t, v: t.delete(val=v), values[::7]),
+    ]
+    total = 0
+    for op, vals in ops:
+        for v in vals:
+            compared[0] = 0
+            op(traced, v)
+            counted = compared[0]
+            total += counted
+            compared[0] = 0
+            op(plain, v)
+            assert compared[0] == counted
+    assert counters.summary()["total"]["comparisons"] == total
@@ -0,0 +1,215 @@
+import pytest
+import random
+import dsaria.sort
+from dsaria import instrumentation
+from dsaria.heap import Heap
+from dsaria.instrumentation import OpCounters
+from dsaria.linked_list import LinkedList
+
+@pytest.fixture(autouse=True)
+def no_global_counters():
+    instrumentation.disable()
+    yield
+    instrumentation.disable()
+
+class Probe:
+    """An int wrapper that counts every comparison made on it."""
+    count = 0
+    def __init__(self, val): self.val = val
+    def __lt__(self, other):
+        Probe.count += 1
+        return self.val < other.val
+    def __gt__(self, other):
+        Probe.count += 1
+        return self.val > other.val
+    def __le__(self, other):
+        Probe.count += 1
+        return self.val <= other.val
+    def __ge__(self, other):
+        Probe.count += 1
+        return self.val >= other.val
+    def __eq__(self, other):
+        Probe.count += 1
+        return self.val == other.val
+
+def test_disabled_by_default():
+    assert instrumentation.active() is None
+    h = Heap(heap_type="min", val_type=int)
+    h.insert(val=1)
+    assert h.counters is None
+
+def test_counters_can_be_attached_later_and_are_type_checked():
+    ll = LinkedList(val_type=int, unique_vals=False)
+    ll.insert(val=1)
+    ll.counters = counters = OpCounters()
+    ll.insert(val=2)
+    assert counters.summary()["linked_list.insert"]["calls"] == 1
+    with pytest.raises(TypeError):
+        ll.counters = {}
+    assert ll.counters is counters
+
+def test_heap_per_instance_counts_match_actual_comparisons():
+    counters = OpCounters()
+    h = Heap(heap_type="min", val_type=Probe, counters=counters)
+    Probe.count = 0
+    for v in random.sample(range(1000), 200): h.insert(val=Probe(v))
+    while len(h): h.extract_top()
+    summary = counters.summary()
+    assert summary["heap.insert"]["calls"] == 200
+    assert summary["heap.extract_top"]["calls"] == 200
+    assert summary["total"]["comparisons"] == Probe.count
+    assert summary["heap.insert"]["swaps"] > 0
+
+def test_heap_insert_swaps_and_allocations():
+    counters = OpCounters()
+    h = Heap(heap_type="min", val_type=int, counters=counters)
+    for v in [5, 3, 1]: h.insert(val=v)
+    assert counters.summary()["heap.insert"]["swaps"] == 2
+    assert counters.summary()["heap.insert"]["allocations"] == 3
+
+def test_heap_extract_swaps():
+    counters = OpCounters()
+    h = Heap(heap_type="min", val_type=int, counters=counters)
+    for v in range(7): h.insert(val=v)
+    counters.reset()
+    h.extract_top()
+    # 6 moves to the root and sinks past 1 and 3 to a leaf.
+    assert counters.summary()["heap.extract_top"]["swaps"] == 2
+    assert h.peek_top() == 1
+
+def test_heap_peek_and_heapify_recorded():
+    counters = OpCounters()
+    h = Heap(heap_type="max", val_type=int, counters=counters)
+    h.insert(val=1)
+    h.peek_top()
+    h.heapify(idx=0)
+    summary = counters.summary()
+    assert summary["heap.peek_top"]["calls"] == 1
+    assert summary["heap.heapify"]["calls"] == 1
+
+def test_linked_list_counts_match_actual_comparisons():
+    values = [Probe(v) for v in random.sample(range(1000), 100)]
+    def run(counters):
+        ll = LinkedList(val_type=Probe, unique_vals=False, counters=counters)
+        for v in values: ll.insert(val=v)
+        for v in values[:20]: ll.search(v)
+    counters = OpCounters()
+    run(counters)
+    Probe.count = 0
+    run(None)
+    summary = counters.summary()
+    assert summary["linked_list.insert"]["allocations"] == 100
+    assert summary["linked_list.insert"]["comparisons"] + summary["linked_list.search"]["comparisons"] == Probe.count
+
+@pytest.mark.parametrize("unique_vals", [True, False])
+def test_linked_list_counts_inline_without_extra_comparisons(unique_vals):
+    values = [Probe(v) for v in random.sample(range(1000), 50)]
+    ll = LinkedList(val_type=Probe, unique_vals=unique_vals)
+    counters = OpCounters()
+    traced = LinkedList(val_type=Probe, unique_vals=unique_vals, counters=counters)
+    total = 0
+    for op, vals in [("insert", values), ("delete", values[::5])]:
+        for v in vals:
+            Probe.count = 0
+            getattr(traced, op)(val=v)
+            instrumented = Probe.count
+            Probe.count = 0
+            getattr(ll, op)(val=v)
+            assert Probe.count == instrumented
+            total += instrumented
+    summary = counters.summary()
+    assert summary["linked_list.insert"]["calls"] == 50
+    assert summary["total"]["comparisons"] == total
+
+def test_linked_list_hops():
+    counters = OpCounters()
+    ll = LinkedList(val_type=int, unique_vals=True, counters=counters)
+    for v in range(10): ll.insert(val=v)
+    counters.reset()
+    ll.search(9)
+    ll.node_with_val_exists(val=4)
+    ll.delete(val=2)
+    assert len(ll) == 9
+    summary = counters.summary()
+    assert summary["linked_list.search"]["node_hops"] == 10
+    assert summary["linked_list.node_with_val_exists"]["node_hops"] == 5
+    assert summary["linked_list.delete"]["node_hops"] == 3
+    assert summary["linked_list.len"]["node_hops"] == 9
+
+def test_per_instance_counters_take_precedence_over_global():
+    mine = OpCounters()
+    with instrumentation.instrumented() as global_counters:
+        h = Heap(heap_type="min", val_type=int, counters=mine)
+        h.insert(val=1)
+        other = Heap(heap_type="min", val_type=int)
+        other.insert(val=1)
+    assert mine.summary()["heap.insert"]["calls"] == 1
+    assert global_counters.summary()["heap.insert"]["calls"] == 1
+    assert instrumentation.active() is None
+
+def test_bubble_sort_counts():
+    with instrumentation.instrumented() as counters:
+        dsaria.sort.bubble_sort(arr=[3, 2, 1])
+    stats = counters.summary()["sort.bubble_sort"]
+    assert stats["swaps"] == 3
+    assert stats["comparisons"] == 3
+
+@pytest.mark.parametrize("call", [
+    lambda a: dsaria.sort.merge_sort(arr=a),
+    lambda a: dsaria.sort.select(arr=a, k=len(a) // 2),
+    lambda a: dsaria.sort.partial_sort(arr=a, k=10),
+    lambda a: dsaria.sort.partition(arr=a, pivot=Probe(500)),
+    lambda a: list(dsaria.sort.lazy_sorted(arr=a)),
+    lambda a: dsaria.sort.sort(arr=a),
+    lambda a: dsaria.sort.sort(arr=a, key=lambda p: p, reverse=True),
+])
+def test_key_aware_sorts_count_exact_comparisons(call):
+    arr = [Probe(random.randrange(1000)) for _ in range(2000)]
+    Probe.count = 0
+    with instrumentation.instrumented() as counters:
+        call(list(arr))
+    instrumented = counters.summary()["total"]["comparisons"]
+    Probe.count = 0
+    call(list(arr))
+    assert instrumented == Probe.count > 0
+
+def test_sort_counts_comparisons_on_counting_path():
+    arr = [random.randrange(100) for _ in range(5000)]
+    with instrumentation.instrumented() as counters:
+        assert dsaria.sort.sort(arr=arr) == sorted(arr)
+    # One min/max pass over the keys plus the presortedness sample; the keys are not scanned again to sort.
+    assert 0 < counters.summary()["sort.sort"]["comparisons"] <= 2 * len(arr) + 2 * dsaria.sort._PROFILE_SAMPLE_SIZE
+
+def test_external_sort_recorded(tmp_path):
+    path = tmp_path / "records.bin"
+    path.write_bytes(b"cab")
+    with instrumentation.instrumented() as counters:
+        result = list(dsaria.sort.external_sort(path=path, record_size=1, tmp_dir=tmp_path))
+    assert result == [b"a", b"b", b"c"]
+    assert counters.summary()["sort.external_sort"]["calls"] == 1
+
+def test_instrumented_results_are_unchanged():
+    arr = [random.randrange(100) for _ in range(3000)]
+    with instrumentation.instrumented():
+        assert dsaria.sort.merge_sort(arr=list(arr)) == sorted(arr)
+        assert dsaria.sort.select(arr=arr, k=5) == sorted(arr)[5]
+        assert dsaria.sort.sort(arr=arr) == sorted(arr)
+        assert dsaria.sort.counting_sort(arr=arr) == sorted(arr)
+
+def test_timer_callback_and_metrics_export():
+    seen = []
+    counters = OpCounters(timer=lambda op, ns: seen.append((op, ns)))
+    with instrumentation.instrumented(counters):
+        dsaria.sort.sort(arr=[2, 1])
+        dsaria.sort.counting_argsort(arr=[2, 1])
+    assert [op for op, _ in seen] == ["sort.sort", "sort.counting_argsort"]
+    assert all(ns >= 0 for _, ns in seen)
+    metrics = counters.to_metrics()
+    assert metrics["dsaria.sort.sort.calls"] == 1
+    assert metrics["dsaria.total.calls"] == 2
+
+def test_errors_are_still_recorded_and_raised():
+    with instrumentation.instrumented() as counters:
+        with pytest.raises(TypeError):
+            dsaria.sort.merge_sort(arr=[1, "a"])
+    assert counters.summary()["sort.merge_sort"]["calls"] == 1
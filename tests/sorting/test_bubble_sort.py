@@ -1,5 +1,6 @@
 import pytest
 import random
+from array import array
 import dsaria.sort
 
 def test_bubble_sort_normal_cases():
@@ -56,4 +57,42 @@ def test_bubble_sort_stable_property():
     objs = [Obj(1,0), Obj(1,1), Obj(2,2), Obj(1,3)]
     sorted_objs = dsaria.sort.bubble_sort(arr=objs)
     orders = [o.order for o in sorted_objs if o.val==1]
-    assert orders == [0,1,3]
\ No newline at end of file
+    assert orders == [0,1,3]
+
+def test_bubble_sort_array_in_place():
+    arr = array("d", [random.uniform(-1, 1) for _ in range(300)])
+    expected = sorted(arr)
+    assert dsaria.sort.bubble_sort(arr=arr) is arr
+    assert list(arr) == expected
+
+def test_bubble_sort_bytearray_in_place():
+    buf = bytearray(b"dcba")
+    dsaria.sort.bubble_sort(arr=buf)
+    assert buf == bytearray(b"abcd")
+
+def test_bubble_sort_into_out_leaves_input_untouched():
+    src = array("i", [3, 1, 2])
+    out = array("i", [0, 0, 0])
+    assert dsaria.sort.bubble_sort(arr=src, out=out) is out
+    assert list(out) == [1, 2, 3]
+    assert list(src) == [3, 1, 2]
+
+def test_bubble_sort_list_into_out_list():
+    arr = [3, 1, 2]
+    out = []
+    assert dsaria.sort.bubble_sort(arr=arr, out=out) == [1, 2, 3]
+    assert arr == [3, 1, 2]
+
+def test_bubble_sort_read_only_buffer_raises_type_error():
+    with pytest.raises(TypeError):
+        dsaria.sort.bubble_sort(arr=memoryview(b"ba"))
+
+def test_bubble_sort_read_only_buffer_into_out():
+    assert dsaria.sort.bubble_sort(arr=b"\x02\x01", out=[]) == [1, 2]
+    out = bytearray(2)
+    dsaria.sort.bubble_sort(arr=memoryview(b"ba"), out=out)
+    assert out == bytearray(b"ab")
+
+def test_bubble_sort_out_format_mismatch_raises_type_error():
+    with pytest.raises(TypeError):
+        dsaria.sort.bubble_sort(arr=array("i", [2, 1]), out=array("d", [0.0, 0.0]))
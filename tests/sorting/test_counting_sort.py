@@ -1,5 +1,6 @@
 import pytest
 import random
+from array import array
 import dsaria.sort
 
 def test_counting_sort_normal_case():
@@ -8,6 +9,7 @@ def test_counting_sort_normal_case():
 
 def test_counting_sort_empty_list():
     assert dsaria.sort.counting_sort(arr=[]) == []
+    assert dsaria.sort.counting_sort(arr=b"") == []
 
 def test_counting_sort_single_element():
     assert dsaria.sort.counting_sort(arr=[42]) == [42]
@@ -56,4 +58,122 @@ def test_counting_sort_single_zero():
 def test_counting_sort_stress_large_range():
     arr = [random.randint(0, 5000) for _ in range(2000)]
     sorted_arr = sorted(arr)
-    assert dsaria.sort.counting_sort(arr=arr) == sorted_arr
\ No newline at end of file
+    assert dsaria.sort.counting_sort(arr=arr) == sorted_arr
+
+def test_counting_sort_records_by_key():
+    records = [("b", 2), ("a", 1), ("c", 0), ("d", 1)]
+    assert dsaria.sort.counting_sort(arr=records, key=lambda r: r[1]) == [("c", 0), ("a", 1), ("d", 1), ("b", 2)]
+
+def test_counting_sort_by_key_is_stable():
+    records = [(random.randint(0, 20), i) for i in range(2000)]
+    assert dsaria.sort.counting_sort(arr=records, key=lambda r: r[0]) == sorted(records, key=lambda r: r[0])
+
+def test_counting_sort_by_key_keeps_record_identity():
+    class Job:
+        def __init__(self, priority): self.priority = priority
+    jobs = [Job(random.randint(0, 5)) for _ in range(100)]
+    result = dsaria.sort.counting_sort(arr=jobs, key=lambda j: j.priority)
+    assert sorted(map(id, result)) == sorted(map(id, jobs))
+    assert [j.priority for j in result] == sorted(j.priority for j in jobs)
+
+def test_counting_sort_non_integer_key_raises_type_error():
+    with pytest.raises(TypeError):
+        dsaria.sort.counting_sort(arr=["a", "b"], key=lambda r: r)
+
+def test_counting_sort_negative_key_raises_value_error():
+    with pytest.raises(ValueError):
+        dsaria.sort.counting_sort(arr=[1, 2], key=lambda r: -r)
+
+def test_counting_argsort_normal_case():
+    arr = [2, 0, 1, 0]
+    assert dsaria.sort.counting_argsort(arr=arr) == [1, 3, 2, 0]
+
+def test_counting_argsort_empty_list():
+    assert dsaria.sort.counting_argsort(arr=[]) == []
+
+def test_counting_argsort_reorders_parallel_columns():
+    buckets = [random.randint(0, 50) for _ in range(1000)]
+    names = [f"row{i}" for i in range(1000)]
+    order = dsaria.sort.counting_argsort(arr=buckets)
+    assert [buckets[i] for i in order] == sorted(buckets)
+    assert [names[i] for i in order] == [names[i] for i in sorted(range(1000), key=buckets.__getitem__)]
+
+def test_counting_argsort_with_key():
+    records = [{"p": 3}, {"p": 1}, {"p": 3}, {"p": 0}]
+    assert dsaria.sort.counting_argsort(arr=records, key=lambda r: r["p"]) == [3, 1, 0, 2]
+
+def test_counting_argsort_float_raises_type_error():
+    with pytest.raises(TypeError):
+        dsaria.sort.counting_argsort(arr=[1, 2.5])
+
+def test_counting_sort_bytearray_in_place():
+    buf = bytearray(random.getrandbits(8) for _ in range(5000))
+    expected = sorted(buf)
+    assert dsaria.sort.counting_sort(arr=buf) is buf
+    assert list(buf) == expected
+
+def test_counting_sort_array_in_place():
+    arr = array("i", [random.randint(0, 10**6) for _ in range(3000)] + [7] * 100000)
+    expected = sorted(arr)
+    dsaria.sort.counting_sort(arr=arr)
+    assert list(arr) == expected
+
+def test_counting_sort_memoryview_and_mmap(tmp_path):
+    import mmap
+    path = tmp_path / "data.bin"
+    path.write_bytes(bytes(random.getrandbits(8) for _ in range(4096)))
+    with open(path, "r+b") as f, mmap.mmap(f.fileno(), 0) as mm:
+        dsaria.sort.counting_sort(arr=mm)
+        assert list(mm[:]) == sorted(path.read_bytes())
+    buf = bytearray(b"\x03\x01\x02")
+    dsaria.sort.counting_sort(arr=memoryview(buf))
+    assert buf == bytearray(b"\x01\x02\x03")
+
+def test_counting_sort_buffer_into_out():
+    src = array("q", [5, 3, 9, 3])
+    out = array("q", [0] * 4)
+    assert dsaria.sort.counting_sort(arr=src, out=out) is out
+    assert list(out) == [3, 3, 5, 9]
+    assert list(src) == [5, 3, 9, 3]
+
+def test_counting_sort_list_into_out():
+    out = array("H", [0] * 3)
+    assert list(dsaria.sort.counting_sort(arr=[2, 0, 1], out=out)) == [0, 1, 2]
+
+def test_counting_sort_buffer_releases_exports():
+    buf = bytearray(b"\x02\x01")
+    dsaria.sort.counting_sort(arr=buf)
+    buf.extend(b"\x00")
+    assert buf == bytearray(b"\x01\x02\x00")
+
+def test_counting_sort_float_buffer_raises_type_error():
+    with pytest.raises(TypeError):
+        dsaria.sort.counting_sort(arr=array("d", [1.0, 2.0]))
+
+def test_counting_sort_negative_buffer_raises_value_error():
+    with pytest.raises(ValueError):
+        dsaria.sort.counting_sort(arr=array("i", [1, -1]))
+
+def test_counting_sort_read_only_buffer_returns_new_list():
+    data = b"\x02\x01\x00\x02"
+    assert dsaria.sort.counting_sort(arr=data) == [0, 1, 2, 2]
+    assert dsaria.sort.counting_sort(arr=memoryview(data)) == [0, 1, 2, 2]
+
+def test_counting_sort_read_only_buffer_into_out():
+    out = bytearray(4)
+    assert dsaria.sort.counting_sort(arr=b"\x02\x01\x00\x02", out=out) is out
+    assert out == bytearray(b"\x00\x01\x02\x02")
+
+def test_counting_sort_buffer_into_list_out():
+    arr = array("q", [5, 2, 7, 2])
+    out = [9]
+    assert dsaria.sort.counting_sort(arr=arr, out=out) is out
+    assert out == [2, 2, 5, 7]
+    assert list(arr) == [5, 2, 7, 2]
+    assert dsaria.sort.counting_sort(arr=bytearray(b"\x03\x01"), out=[]) == [1, 3]
+    with pytest.raises(TypeError):
+        dsaria.sort.counting_sort(arr=array("d", [1.0]), out=[])
+
+def test_counting_sort_out_length_mismatch_raises_value_error():
+    with pytest.raises(ValueError):
+        dsaria.sort.counting_sort(arr=array("i", [1, 2]), out=array("i", [0]))
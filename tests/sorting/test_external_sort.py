@@ -0,0 +1,79 @@
+import pytest
+import random
+import struct
+import dsaria.sort
+
+RECORD = struct.Struct(">IH")
+
+def write_records(path, values):
+    with open(path, "wb") as f:
+        for i, v in enumerate(values): f.write(RECORD.pack(v, i % 65536))
+    return path
+
+def read_keys(records):
+    return [RECORD.unpack(r)[0] for r in records]
+
+def test_external_sort_fits_in_memory(tmp_path):
+    values = [random.randint(0, 1000) for _ in range(200)]
+    path = write_records(tmp_path / "in.bin", values)
+    out = list(dsaria.sort.external_sort(path=path, record_size=RECORD.size))
+    assert read_keys(out) == sorted(values)
+
+def test_external_sort_spills_runs(tmp_path):
+    values = [random.randint(0, 10**6) for _ in range(5000)]
+    path = write_records(tmp_path / "in.bin", values)
+    out = list(dsaria.sort.external_sort(path=path, record_size=RECORD.size, memory_limit=4096, tmp_dir=tmp_path))
+    assert read_keys(out) == sorted(values)
+    assert [p.name for p in tmp_path.iterdir()] == ["in.bin"]
+
+def test_external_sort_multi_pass_merge(tmp_path, monkeypatch):
+    monkeypatch.setattr(dsaria.sort, "_MERGE_FAN_IN", 3)
+    values = [random.randint(0, 10**6) for _ in range(3000)]
+    path = write_records(tmp_path / "in.bin", values)
+    out = list(dsaria.sort.external_sort(path=path, record_size=RECORD.size, memory_limit=2048))
+    assert read_keys(out) == sorted(values)
+
+def test_external_sort_empty_file(tmp_path):
+    path = write_records(tmp_path / "in.bin", [])
+    assert list(dsaria.sort.external_sort(path=path, record_size=RECORD.size)) == []
+
+def test_external_sort_key_and_reverse(tmp_path):
+    values = [random.randint(0, 100) for _ in range(2000)]
+    path = write_records(tmp_path / "in.bin", values)
+    out = list(dsaria.sort.external_sort(path=path, record_size=RECORD.size, memory_limit=2048,
+                                         key=lambda r: r[4:], reverse=True))
+    tags = [RECORD.unpack(r)[1] for r in out]
+    assert tags == sorted(tags, reverse=True)
+
+def test_external_sort_is_stable(tmp_path):
+    values = [random.randint(0, 5) for _ in range(3000)]
+    path = write_records(tmp_path / "in.bin", values)
+    out = list(dsaria.sort.external_sort(path=path, record_size=RECORD.size, memory_limit=2048,
+                                         key=lambda r: r[:4]))
+    expected = sorted(((v, i) for i, v in enumerate(values)), key=lambda t: t[0])
+    assert [RECORD.unpack(r) for r in out] == [(v, i % 65536) for v, i in expected]
+
+def test_external_sort_output_to_file(tmp_path):
+    values = [random.randint(0, 10**6) for _ in range(1000)]
+    path = write_records(tmp_path / "in.bin", values)
+    with open(tmp_path / "out.bin", "wb") as f:
+        f.writelines(dsaria.sort.external_sort(path=path, record_size=RECORD.size, memory_limit=1024))
+    data = (tmp_path / "out.bin").read_bytes()
+    assert read_keys(data[i:i + RECORD.size] for i in range(0, len(data), RECORD.size)) == sorted(values)
+
+def test_external_sort_partial_record_raises_value_error(tmp_path):
+    path = tmp_path / "in.bin"
+    path.write_bytes(b"\x00" * (RECORD.size * 3 + 1))
+    with pytest.raises(ValueError):
+        list(dsaria.sort.external_sort(path=path, record_size=RECORD.size))
+
+def test_external_sort_invalid_parameters_raise_value_error(tmp_path):
+    path = write_records(tmp_path / "in.bin", [1, 2, 3])
+    with pytest.raises(ValueError):
+        dsaria.sort.external_sort(path=path, record_size=0)
+    with pytest.raises(ValueError):
+        dsaria.sort.external_sort(path=path, record_size=RECORD.size, memory_limit=0)
+
+def test_external_sort_missing_file_raises_at_call_site(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        dsaria.sort.external_sort(path=tmp_path / "missing.bin", record_size=RECORD.size)
@@ -0,0 +1,64 @@
+import pytest
+import random
+from itertools import islice
+import dsaria.sort
+
+def test_lazy_sorted_normal_case():
+    arr = [5, 3, 9, 1, 7]
+    assert list(dsaria.sort.lazy_sorted(arr=arr)) == [1, 3, 5, 7, 9]
+    assert arr == [5, 3, 9, 1, 7]
+
+def test_lazy_sorted_empty_and_single():
+    assert list(dsaria.sort.lazy_sorted(arr=[])) == []
+    assert list(dsaria.sort.lazy_sorted(arr=[1])) == [1]
+
+def test_lazy_sorted_first_page():
+    arr = [random.random() for _ in range(20000)]
+    assert list(islice(dsaria.sort.lazy_sorted(arr=arr), 50)) == sorted(arr)[:50]
+
+def test_lazy_sorted_large_random():
+    arr = [random.randint(-10**6, 10**6) for _ in range(20000)]
+    assert list(dsaria.sort.lazy_sorted(arr=arr)) == sorted(arr)
+
+@pytest.mark.parametrize("arr", [
+    list(range(5000)),
+    list(range(5000, 0, -1)),
+    [7] * 5000,
+    [random.randint(0, 3) for _ in range(5000)],
+])
+def test_lazy_sorted_structured_inputs(arr):
+    assert list(dsaria.sort.lazy_sorted(arr=arr)) == sorted(arr)
+    assert list(dsaria.sort.lazy_sorted(arr=arr, reverse=True)) == sorted(arr, reverse=True)
+
+def test_lazy_sorted_reverse():
+    arr = [random.random() for _ in range(3000)]
+    assert list(dsaria.sort.lazy_sorted(arr=arr, reverse=True)) == sorted(arr, reverse=True)
+
+def test_lazy_sorted_key_is_stable():
+    arr = [(random.randint(0, 20), i) for i in range(5000)]
+    assert list(dsaria.sort.lazy_sorted(arr=arr, key=lambda t: t[0])) == sorted(arr, key=lambda t: t[0])
+    assert list(dsaria.sort.lazy_sorted(arr=arr, key=lambda t: t[0], reverse=True)) == sorted(arr, key=lambda t: t[0], reverse=True)
+
+def test_lazy_sorted_snapshots_input():
+    arr = [3, 1, 2]
+    it = dsaria.sort.lazy_sorted(arr=arr)
+    assert next(it) == 1
+    arr.append(0)
+    assert list(it) == [2, 3]
+
+def test_lazy_sorted_mixed_types_raises_type_error():
+    with pytest.raises(TypeError):
+        list(dsaria.sort.lazy_sorted(arr=[1, "2", 3]))
+
+def test_lazy_sorted_cost_follows_consumption():
+    from dsaria.instrumentation import instrumented
+    n = 50_000
+    arr = [random.random() for _ in range(n)]
+    def comparisons(run):
+        with instrumented() as counters: run()
+        return counters.summary()["total"]["comparisons"]
+    full_sort = comparisons(lambda: dsaria.sort.merge_sort(arr=list(arr)))
+    # O(n + m log m): about 2n to reach the first block, then a small extra cost per element read.
+    assert comparisons(lambda: list(islice(dsaria.sort.lazy_sorted(arr=arr), 100))) < 2.5 * n
+    assert comparisons(lambda: list(islice(dsaria.sort.lazy_sorted(arr=arr), n // 8))) < 0.35 * full_sort
+    assert comparisons(lambda: list(dsaria.sort.lazy_sorted(arr=arr))) < 1.25 * full_sort
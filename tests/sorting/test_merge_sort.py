@@ -0,0 +1,66 @@
+import pytest
+import random
+import dsaria.sort
+
+def noisy_sorted(n, pct):
+    arr = list(range(n))
+    for _ in range(n * pct // 100): arr[random.randrange(n)] = random.randrange(n)
+    return arr
+
+def test_merge_sort_normal_cases():
+    assert dsaria.sort.merge_sort(arr=[1, 3, 4, 5, 2, 6]) == [1, 2, 3, 4, 5, 6]
+    assert dsaria.sort.merge_sort(arr=[5, 4, 3, 2, 1]) == [1, 2, 3, 4, 5]
+
+def test_merge_sort_empty_and_single():
+    assert dsaria.sort.merge_sort(arr=[]) == []
+    assert dsaria.sort.merge_sort(arr=[1]) == [1]
+
+def test_merge_sort_is_in_place():
+    arr = [3, 1, 2]
+    assert dsaria.sort.merge_sort(arr=arr) is arr
+    assert arr == [1, 2, 3]
+
+@pytest.mark.parametrize("arr", [
+    [random.random() for _ in range(5000)],
+    list(range(5000)),
+    list(range(5000, 0, -1)),
+    noisy_sorted(5000, 1),
+    noisy_sorted(5000, 10),
+    [random.randint(0, 3) for _ in range(5000)],
+    [i % 97 for i in range(5000)],
+    list(range(2500)) + list(range(2500, 0, -1)),
+])
+def test_merge_sort_distributions(arr):
+    expected = sorted(arr)
+    assert dsaria.sort.merge_sort(arr=list(arr)) == expected
+    assert dsaria.sort.merge_sort(arr=list(arr), reverse=True) == expected[::-1]
+
+def test_merge_sort_strings():
+    assert dsaria.sort.merge_sort(arr=["b", "a", "c"]) == ["a", "b", "c"]
+
+def test_merge_sort_key_is_stable():
+    arr = [(random.randint(0, 10), i) for i in range(3000)]
+    assert dsaria.sort.merge_sort(arr=list(arr), key=lambda t: t[0]) == sorted(arr, key=lambda t: t[0])
+
+def test_merge_sort_reverse_is_stable():
+    arr = [(random.randint(0, 10), i) for i in range(3000)]
+    assert dsaria.sort.merge_sort(arr=list(arr), key=lambda t: t[0], reverse=True) == sorted(arr, key=lambda t: t[0], reverse=True)
+
+def test_merge_sort_descending_run_with_ties_is_stable():
+    arr = [(3, "a"), (2, "b"), (2, "c"), (1, "d")] * 20
+    assert dsaria.sort.merge_sort(arr=list(arr), key=lambda t: t[0]) == sorted(arr, key=lambda t: t[0])
+
+def test_merge_sort_stable_property():
+    class Obj:
+        def __init__(self, val, order):
+            self.val = val
+            self.order = order
+        def __lt__(self, other): return self.val < other.val
+
+    objs = [Obj(random.randint(0, 3), i) for i in range(500)]
+    sorted_objs = dsaria.sort.merge_sort(arr=list(objs))
+    assert [(o.val, o.order) for o in sorted_objs] == sorted(((o.val, o.order) for o in objs))
+
+def test_merge_sort_mixed_types_raises_type_error():
+    with pytest.raises(TypeError):
+        dsaria.sort.merge_sort(arr=[1, "2", 3])
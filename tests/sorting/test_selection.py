@@ -0,0 +1,127 @@
+import pytest
+import random
+import dsaria.sort
+
+def test_select_normal_case():
+    arr = [7, 1, 5, 3, 9]
+    assert [dsaria.sort.select(arr=arr, k=k) for k in range(5)] == [1, 3, 5, 7, 9]
+    assert arr == [7, 1, 5, 3, 9]
+
+def test_select_single_element():
+    assert dsaria.sort.select(arr=[42], k=0) == 42
+
+def test_select_out_of_range_raises_index_error():
+    with pytest.raises(IndexError):
+        dsaria.sort.select(arr=[1, 2, 3], k=3)
+    with pytest.raises(IndexError):
+        dsaria.sort.select(arr=[], k=0)
+
+def test_select_large_random_median():
+    arr = [random.randint(-10**6, 10**6) for _ in range(20001)]
+    assert dsaria.sort.select(arr=arr, k=10000) == sorted(arr)[10000]
+
+def test_select_duplicates():
+    arr = [random.randint(0, 3) for _ in range(5000)]
+    expected = sorted(arr)
+    for k in [0, 1000, 2500, 4999]:
+        assert dsaria.sort.select(arr=arr, k=k) == expected[k]
+
+def test_select_in_place_rearranges_like_nth_element():
+    arr = [random.randint(0, 1000) for _ in range(3000)]
+    original = list(arr)
+    val = dsaria.sort.select(arr=arr, k=1234, in_place=True)
+    assert arr[1234] == val == sorted(original)[1234]
+    assert all(x <= val for x in arr[:1234])
+    assert all(x >= val for x in arr[1234:])
+    assert sorted(arr) == sorted(original)
+
+def test_select_with_key_returns_stable_element():
+    arr = [(random.randint(0, 10), i) for i in range(2000)]
+    expected = sorted(arr, key=lambda t: t[0])
+    for k in [0, 500, 1999]:
+        assert dsaria.sort.select(arr=arr, k=k, key=lambda t: t[0]) == expected[k]
+
+@pytest.mark.parametrize("arr", [
+    list(range(5000)),
+    list(range(5000, 0, -1)),
+    list(range(2500)) + list(range(2500, 0, -1)),
+    [1] * 5000,
+])
+def test_select_adversarial_inputs_with_single_pivot(arr, monkeypatch):
+    # A one-element sample degenerates to single-pivot quickselect and exercises the median-of-medians fallback.
+    monkeypatch.setattr(dsaria.sort, "_SELECT_SAMPLE", 1)
+    assert dsaria.sort.select(arr=arr, k=1717) == sorted(arr)[1717]
+
+def test_partial_sort_normal_case():
+    assert dsaria.sort.partial_sort(arr=[9, 4, 7, 1, 8, 2], k=3) == [1, 2, 4]
+
+def test_partial_sort_zero_and_full():
+    arr = [3, 1, 2]
+    assert dsaria.sort.partial_sort(arr=arr, k=0) == []
+    assert dsaria.sort.partial_sort(arr=arr, k=3) == [1, 2, 3]
+
+def test_partial_sort_out_of_range_raises_value_error():
+    with pytest.raises(ValueError):
+        dsaria.sort.partial_sort(arr=[1, 2], k=3)
+
+@pytest.mark.parametrize("k", [1, 10, 100, 1500, 3000])
+def test_partial_sort_matches_sorted_prefix(k):
+    arr = [(random.randint(0, 50), i) for i in range(3000)]
+    assert dsaria.sort.partial_sort(arr=arr, k=k, key=lambda t: t[0]) == sorted(arr, key=lambda t: t[0])[:k]
+
+def test_partial_sort_in_place():
+    arr = [random.random() for _ in range(2000)]
+    original = list(arr)
+    result = dsaria.sort.partial_sort(arr=arr, k=20, in_place=True)
+    assert result is arr
+    assert arr[:20] == sorted(original)[:20]
+    assert sorted(arr) == sorted(original)
+
+def test_partition_normal_case():
+    arr = [5, 1, 4, 2, 4]
+    assert dsaria.sort.partition(arr=arr, pivot=4) == (2, 4)
+    assert arr == [1, 2, 4, 4, 5]
+
+def test_partition_pivot_not_present():
+    arr = [5, 1, 7, 2]
+    assert dsaria.sort.partition(arr=arr, pivot=3) == (2, 2)
+    assert arr == [1, 2, 5, 7]
+
+def test_partition_with_key_is_stable():
+    arr = [("a", 3), ("b", 1), ("c", 3), ("d", 5), ("e", 0)]
+    lt, gt = dsaria.sort.partition(arr=arr, pivot=3, key=lambda t: t[1])
+    assert (lt, gt) == (2, 4)
+    assert arr == [("b", 1), ("e", 0), ("a", 3), ("c", 3), ("d", 5)]
+
+def test_partition_empty_list():
+    arr = []
+    assert dsaria.sort.partition(arr=arr, pivot=1) == (0, 0)
+
+@pytest.mark.parametrize("distinct", [2, 3, 10])
+def test_select_few_distinct_values_at_value_boundaries(distinct, monkeypatch):
+    rng = random.Random(distinct)
+    arr = [rng.randrange(distinct) for _ in range(50_000)]
+    expected = sorted(arr)
+    calls = []
+    split3 = dsaria.sort._split3
+    monkeypatch.setattr(dsaria.sort, "_split3", lambda **kw: calls.append(1) or split3(**kw))
+    for v in range(distinct):
+        boundary = expected.index(v)
+        for k in {max(0, boundary - 1), boundary}:
+            calls.clear()
+            assert dsaria.sort.select(arr=arr, k=k) == expected[k]
+            # Each pass must shrink the segment; a stalled loop would make ~2*log2(n) passes.
+            assert len(calls) <= 4
+    assert dsaria.sort.partial_sort(arr=arr, k=len(arr) // 2) == expected[:len(arr) // 2]
+
+def test_select_falls_back_when_pivots_make_no_progress(monkeypatch):
+    n = 50_000
+    arr = random.Random(1).sample(range(n), n)
+    touched = []
+    split3 = dsaria.sort._split3
+    monkeypatch.setattr(dsaria.sort, "_split3", lambda **kw: touched.append(len(kw["seg"])) or split3(**kw))
+    # A margin as large as the sample puts the pivots at its extremes, so each sampled step barely shrinks the segment.
+    monkeypatch.setattr(dsaria.sort, "isqrt", lambda x: x)
+    assert dsaria.sort.select(arr=arr, k=n // 3) == n // 3
+    # Median of medians must take over after two stalled steps instead of ~2*log2(n) full passes.
+    assert sum(touched) <= 8 * n
@@ -0,0 +1,92 @@
+import pytest
+import logging
+import random
+import dsaria.sort
+
+def test_sort_normal_case():
+    arr = [5, 2, 9, 1, 5, 6]
+    assert dsaria.sort.sort(arr=arr) == sorted(arr)
+
+def test_sort_does_not_modify_input():
+    arr = [3, 1, 2]
+    dsaria.sort.sort(arr=arr)
+    assert arr == [3, 1, 2]
+
+def test_sort_empty_and_single():
+    assert dsaria.sort.sort(arr=[]) == []
+    assert dsaria.sort.sort(arr=[1]) == [1]
+    assert dsaria.sort.choose_strategy(arr=[1]).name == "trivial"
+
+def test_sort_presorted_input():
+    arr = list(range(10000))
+    assert dsaria.sort.choose_strategy(arr=arr).name == "presorted"
+    assert dsaria.sort.sort(arr=arr) == arr
+
+def test_sort_strictly_reversed_input():
+    arr = list(range(10000, 0, -1))
+    assert dsaria.sort.choose_strategy(arr=arr).name == "reversed"
+    assert dsaria.sort.sort(arr=arr) == sorted(arr)
+
+def test_sort_reversed_with_ties_is_not_reversed_blindly():
+    arr = [(3, "a"), (2, "b"), (2, "c"), (1, "d")]
+    strategy = dsaria.sort.choose_strategy(arr=arr, key=lambda t: t[0])
+    assert strategy.name != "reversed"
+    assert dsaria.sort.sort(arr=arr, key=lambda t: t[0]) == [(1, "d"), (2, "b"), (2, "c"), (3, "a")]
+
+def test_sort_reverse_flag():
+    arr = [random.randint(-50, 50) for _ in range(500)]
+    assert dsaria.sort.sort(arr=arr, reverse=True) == sorted(arr, reverse=True)
+    ascending = sorted(arr)
+    assert dsaria.sort.choose_strategy(arr=ascending[::-1], reverse=True).name == "presorted"
+
+def test_sort_small_range_integers_use_counting():
+    arr = [random.randint(-100, 100) for _ in range(10000)]
+    assert dsaria.sort.choose_strategy(arr=arr).name == "counting"
+    assert dsaria.sort.sort(arr=arr) == sorted(arr)
+    assert dsaria.sort.sort(arr=arr, reverse=True) == sorted(arr, reverse=True)
+
+def test_sort_wide_range_integers_use_timsort():
+    arr = [random.randint(0, 10**9) for _ in range(10000)]
+    strategy = dsaria.sort.choose_strategy(arr=arr)
+    assert strategy.name == "timsort"
+    assert "range" in strategy.reason
+    assert dsaria.sort.sort(arr=arr) == sorted(arr)
+
+def test_sort_bools_are_not_counted_as_integers():
+    arr = [random.random() < 0.5 for _ in range(10000)]
+    assert dsaria.sort.choose_strategy(arr=arr).name == "timsort"
+    result = dsaria.sort.sort(arr=arr)
+    assert result == sorted(arr)
+    assert all(type(v) is bool for v in result)
+
+def test_sort_with_key_is_stable():
+    arr = [(random.randint(0, 5), i) for i in range(1000)]
+    assert dsaria.sort.sort(arr=arr, key=lambda t: t[0]) == sorted(arr, key=lambda t: t[0])
+    assert dsaria.sort.sort(arr=arr, key=lambda t: t[0], reverse=True) == sorted(arr, key=lambda t: t[0], reverse=True)
+
+def test_sort_strings():
+    assert dsaria.sort.sort(arr=["b", "c", "a"]) == ["a", "b", "c"]
+
+def test_sort_mixed_types_raises_type_error():
+    with pytest.raises(TypeError):
+        dsaria.sort.sort(arr=[1, "2", 3])
+
+def test_sort_logs_chosen_strategy(caplog):
+    with caplog.at_level(logging.DEBUG, logger="dsaria.sort"):
+        dsaria.sort.sort(arr=[2, 1, 3])
+    assert "timsort" in caplog.text
+
+def test_sort_records_with_small_integer_keys_use_counting():
+    arr = [(random.randint(-10, 10), i) for i in range(10000)]
+    assert dsaria.sort.choose_strategy(arr=arr, key=lambda t: t[0]).name == "counting"
+    assert dsaria.sort.sort(arr=arr, key=lambda t: t[0]) == sorted(arr, key=lambda t: t[0])
+    assert dsaria.sort.sort(arr=arr, key=lambda t: t[0], reverse=True) == sorted(arr, key=lambda t: t[0], reverse=True)
+
+def test_sort_calls_key_once_per_element():
+    calls = []
+    def key(t):
+        calls.append(t)
+        return t[0]
+    arr = [(random.random(), i) for i in range(1000)]
+    assert dsaria.sort.sort(arr=arr, key=key) == sorted(arr, key=lambda t: t[0])
+    assert len(calls) == len(arr)
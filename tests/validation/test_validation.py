@@ -0,0 +1,111 @@
+import pytest
+import dsaria.sort
+from dsaria import validation
+from dsaria.heap import Heap
+from dsaria.linked_list import LinkedList
+from dsaria.order_statistic_tree import OrderStatisticTree
+
+@pytest.fixture(autouse=True)
+def full_validation():
+    validation.set_mode("full")
+    yield
+    validation.set_mode("full")
+
+def test_default_mode_is_full():
+    assert validation.get_mode() == "full"
+    with pytest.raises(TypeError):
+        dsaria.sort.bubble_sort(arr=[1] * 100 + ["a"] + [1] * 100)
+
+def test_invalid_modes_rejected():
+    with pytest.raises(ValueError):
+        validation.set_mode("none")
+    with pytest.raises(ValueError):
+        Heap(heap_type="min", val_type=int, validate="fast")
+    with pytest.raises(ValueError):
+        LinkedList(val_type=int, unique_vals=False, validate="fast")
+    assert validation.get_mode() == "full"
+
+@pytest.mark.parametrize("make", [
+    lambda: Heap(heap_type="min", val_type=int),
+    lambda: LinkedList(val_type=int, unique_vals=False),
+    lambda: OrderStatisticTree(val_type=int, unique_vals=False),
+])
+def test_per_instance_mode_setter_validates(make):
+    structure = make()
+    with pytest.raises(ValueError):
+        structure.validate = "bogus"
+    assert structure.validate is None
+    structure.validate = "off"
+    structure.insert(val=2.5)
+    structure.validate = None
+    with pytest.raises(TypeError):
+        structure.insert(val=2.5)
+
+def test_context_manager_restores_mode():
+    with validation.validation("off") as mode:
+        assert mode == validation.get_mode() == "off"
+        with validation.validation("sampled"):
+            assert validation.get_mode() == "sampled"
+        assert validation.get_mode() == "off"
+    assert validation.get_mode() == "full"
+
+def test_to_check_sample_is_bounded_and_covers_both_ends():
+    values = list(range(10_000))
+    sample = validation.to_check(values=values, mode="sampled")
+    assert len(sample) == validation.SAMPLE_SIZE
+    assert sample[0] == 0 and sample[-1] == 9999
+    assert validation.to_check(values=values[:10], mode="sampled") == values[:10]
+    assert validation.to_check(values=values, mode="full") is values
+    assert list(validation.to_check(values=values, mode="off")) == []
+
+def test_sampled_mode_checks_only_a_sample():
+    arr = [3, 1] + ["a"] + [2] * 1000
+    with validation.validation("sampled"):
+        with pytest.raises(TypeError):
+            dsaria.sort.counting_sort(arr=[1] * 1000 + [1.5])
+        # The odd element is missed by the sample, so the sort itself hits it.
+        with pytest.raises(TypeError, match="not supported"):
+            dsaria.sort.bubble_sort(arr=arr)
+
+def test_off_mode_sorts_valid_input():
+    arr = [5, 3, 9, 0, 3, 1]
+    with validation.validation("off"):
+        assert dsaria.sort.bubble_sort(arr=list(arr)) == sorted(arr)
+        assert dsaria.sort.counting_sort(arr=list(arr)) == sorted(arr)
+        assert dsaria.sort.counting_argsort(arr=arr) == sorted(range(len(arr)), key=arr.__getitem__)
+
+def test_off_mode_still_rejects_negative_counting_keys():
+    with validation.validation("off"):
+        with pytest.raises(ValueError):
+            dsaria.sort.counting_sort(arr=[3, -1, 2])
+        with pytest.raises(ValueError):
+            dsaria.sort.counting_sort(arr=["ab", "c"], key=lambda s: -len(s))
+
+def test_heap_per_instance_mode_overrides_global():
+    trusted = Heap(heap_type="min", val_type=int, validate="off")
+    trusted.insert(val=2.5)
+    trusted.insert(val=1)
+    assert trusted.extract_top() == 1
+    with validation.validation("off"):
+        strict = Heap(heap_type="min", val_type=int, validate="full")
+        with pytest.raises(TypeError):
+            strict.insert(val=2.5)
+        Heap(heap_type="min", val_type=int).insert(val=2.5)
+
+def test_single_values_checked_when_sampled():
+    with validation.validation("sampled"):
+        with pytest.raises(TypeError):
+            Heap(heap_type="min", val_type=int).insert(val="a")
+        with pytest.raises(TypeError):
+            LinkedList(val_type=int, unique_vals=False).insert(val="a")
+
+def test_linked_list_off_mode():
+    ll = LinkedList(val_type=int, unique_vals=True, validate="off")
+    for v in [3, 1.5, 2]: ll.insert(val=v)
+    assert ll.to_list() == [1.5, 2, 3]
+    assert ll.node_with_val_exists(val=1.5)
+    assert ll.search(2.0).val == 2
+    ll.delete(val=1.5)
+    assert ll.to_list() == [2, 3]
+    with pytest.raises(ValueError):
+        ll.insert(val=2)